@@ -2,12 +2,19 @@
 Event bus for decoupled communication between components.
 Thread-safe and Qt-compatible.
 """
-from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Callable
-from collections import defaultdict
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
+from collections import deque
+from weakref import WeakMethod
+import inspect
+import logging
 import threading
-import queue
+
+_log = logging.getLogger(__name__)
+
+# Shared read-only payload for events created without one
+_EMPTY_PAYLOAD: Mapping[str, Any] = MappingProxyType({})
 
 
 class EventType(Enum):
@@ -41,12 +48,105 @@ class EventType(Enum):
     DOWNLOAD_ERROR = auto()
 
 
-@dataclass
+_LEVEL_TO_EVENT: dict[str, EventType] = {
+    "info": EventType.LOG_INFO,
+    "warning": EventType.LOG_WARNING,
+    "error": EventType.LOG_ERROR,
+    "debug": EventType.LOG_DEBUG,
+}
+
+
+# State snapshot events: only the newest per task needs delivering
+_COALESCED_TYPES = frozenset({EventType.TASK_UPDATED, EventType.DOWNLOAD_PROGRESS})
+
+# Free-list capacity per event type
+_EVENT_POOL_SIZE = 256
+
+
 class Event:
-    """An event with type and payload."""
-    type: EventType
-    payload: dict[str, Any] = field(default_factory=dict)
-    source: str = ""
+    """
+    An event with type and payload.
+    
+    Instances are recycled through bounded per-type free-lists: use
+    Event.acquire() on hot paths and Event.release() once an event has been
+    dispatched. Keeping a list per type stops a burst of one type (e.g.
+    progress) from crowding every other type out of the pool.
+    """
+    
+    __slots__ = ("type", "payload", "source")
+    
+    POOL_SIZE = _EVENT_POOL_SIZE
+    # deque pop/append are atomic, so the pools are safe to share across threads
+    _pools: dict[EventType, deque["Event"]] = {
+        event_type: deque(maxlen=_EVENT_POOL_SIZE) for event_type in EventType
+    }
+    
+    def __init__(
+        self,
+        type: EventType,
+        payload: Optional[Mapping[str, Any]] = None,
+        source: str = ""
+    ):
+        self.type = type
+        self.payload = payload if payload is not None else _EMPTY_PAYLOAD
+        self.source = source
+    
+    def __repr__(self) -> str:
+        return f"Event(type={self.type}, payload={self.payload!r}, source={self.source!r})"
+    
+    @classmethod
+    def acquire(
+        cls,
+        type: EventType,
+        payload: Optional[Mapping[str, Any]] = None,
+        source: str = ""
+    ) -> "Event":
+        """Get an event from the pool, or construct one if the pool is empty."""
+        try:
+            event = cls._pools[type].pop()
+        except IndexError:
+            return cls(type, payload, source)
+        event.payload = payload if payload is not None else _EMPTY_PAYLOAD
+        event.source = source
+        return event
+    
+    @classmethod
+    def release(cls, event: "Event") -> None:
+        """Return a dispatched event to the pool."""
+        event.payload = _EMPTY_PAYLOAD
+        event.source = ""
+        cls._pools[event.type].append(event)
+
+
+def _subscriber_entry(callback: Callable) -> Callable:
+    """Wrap bound methods weakly so subscribing doesn't keep their owner alive."""
+    if inspect.ismethod(callback):
+        return WeakMethod(callback)
+    return callback
+
+
+def _dispatch(event: Event, callbacks: tuple[Callable, ...]) -> bool:
+    """
+    Call each callback with the event.
+    A failing handler is logged and the remaining handlers still run; the
+    try block wraps the whole loop and resumes the shared iterator.
+    
+    Returns True if a dead weak subscriber was skipped.
+    """
+    dead = False
+    remaining = iter(callbacks)
+    while True:
+        try:
+            for callback in remaining:
+                if type(callback) is WeakMethod:
+                    callback = callback()
+                    if callback is None:
+                        dead = True
+                        continue
+                callback(event)
+            return dead
+        except Exception:
+            _log.exception("Error in event handler")
 
 
 class EventBus:
@@ -55,37 +155,68 @@ class EventBus:
     Supports both immediate callbacks and queued events for UI thread safety.
     """
     
-    _instance = None
-    _lock = threading.Lock()
+    _instance: Optional["EventBus"] = None
     
     def __new__(cls):
-        """Singleton pattern for global event bus."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
+        """
+        Singleton pattern for global event bus.
+        The instance is built once at module import, so no locking is needed.
+        """
+        instance = cls._instance
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._setup()
+        return instance
+    
+    @classmethod
+    def instance(cls) -> "EventBus":
+        """Return the global event bus."""
         return cls._instance
     
-    def __init__(self):
-        if self._initialized:
-            return
-        self._initialized = True
-        self._subscribers: dict[EventType, list[Callable]] = defaultdict(list)
-        self._queue: queue.Queue[Event] = queue.Queue()
+    def _setup(self) -> None:
+        # Copy-on-write: each entry is an immutable tuple that is swapped
+        # wholesale on subscribe/unsubscribe, so publishers never need the lock.
+        # Bound methods are held as WeakMethod and pruned once their owner dies.
+        self._subscribers: dict[EventType, tuple[Callable, ...]] = {}
+        # Insertion-ordered registry behind the snapshots, giving O(1)
+        # membership checks and removal. Only touched under the lock.
+        self._registry: dict[EventType, dict[Callable, None]] = {}
+        # deque.append/popleft are atomic under the GIL, so producers never block
+        self._queue: deque[Event] = deque()
+        self._wake = threading.Event()
+        # Called from the publishing thread when events land on an idle queue
+        self._wake_callback: Optional[Callable[[], None]] = None
         self._lock = threading.Lock()
     
     def subscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
         """Subscribe to an event type."""
+        entry = _subscriber_entry(callback)
         with self._lock:
-            if callback not in self._subscribers[event_type]:
-                self._subscribers[event_type].append(callback)
+            registry = self._registry.setdefault(event_type, {})
+            if entry not in registry:
+                registry[entry] = None
+                self._subscribers[event_type] = tuple(registry)
     
     def unsubscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
         """Unsubscribe from an event type."""
+        entry = _subscriber_entry(callback)
         with self._lock:
-            if callback in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(callback)
+            registry = self._registry.get(event_type, {})
+            if entry in registry:
+                del registry[entry]
+                self._subscribers[event_type] = tuple(registry)
+    
+    def _prune_dead(self, event_type: EventType) -> None:
+        """Drop weak subscribers whose owner has been garbage collected."""
+        with self._lock:
+            registry = self._registry.get(event_type, {})
+            for cb in [cb for cb in registry if type(cb) is WeakMethod and cb() is None]:
+                del registry[cb]
+            self._subscribers[event_type] = tuple(registry)
+    
+    def has_subscribers(self, event_type: EventType) -> bool:
+        """Return True if anything is subscribed to the event type."""
+        return bool(self._subscribers.get(event_type))
     
     def publish(self, event: Event) -> None:
         """
@@ -93,54 +224,114 @@ class EventBus:
         Note: Callbacks are called in the publishing thread.
         For UI safety, use publish_to_queue() and process in UI thread.
         """
-        with self._lock:
-            subscribers = list(self._subscribers[event.type])
-        
-        for callback in subscribers:
-            try:
-                callback(event)
-            except Exception as e:
-                print(f"Error in event handler: {e}")
+        if _dispatch(event, self._subscribers.get(event.type, ())):
+            self._prune_dead(event.type)
     
     def publish_to_queue(self, event: Event) -> None:
         """
         Add event to queue for later processing (UI thread safe).
         """
-        self._queue.put(event)
+        self._queue.append(event)
+        wake = self._wake
+        if not wake.is_set():
+            wake.set()
+            callback = self._wake_callback
+            if callback is not None:
+                callback()
+    
+    def set_wake_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        """
+        Register a callback run when events are queued while the queue is
+        idle, so the consumer can be signaled instead of polling.
+        
+        It runs in the publishing thread and fires once per idle-to-pending
+        transition, not per event: a consumer that leaves events behind
+        (see has_pending) must schedule its next drain itself.
+        Pass None to remove it.
+        """
+        self._wake_callback = callback
+    
+    def has_pending(self) -> bool:
+        """Return True if queued events are waiting to be processed."""
+        return bool(self._queue)
+    
+    def drain_coalesced(self, max_items: int = 1000) -> list[Event]:
+        """
+        Pop up to max_items queued events, dropping superseded ones.
+        
+        TASK_UPDATED and DOWNLOAD_PROGRESS events are state snapshots, so
+        only the latest per (type, task_id) is kept, in the position of that
+        latest event. All other events are returned in order. Superseded
+        events go back to the pool.
+        """
+        q = self._queue
+        batch: list[Optional[Event]] = []
+        latest: dict[tuple[EventType, Any], int] = {}
+        for _ in range(min(max_items, len(q))):
+            event = q.popleft()
+            if event.type in _COALESCED_TYPES:
+                key = (event.type, event.payload.get("task_id"))
+                index = latest.get(key)
+                if index is not None:
+                    Event.release(batch[index])
+                    batch[index] = None
+                latest[key] = len(batch)
+            batch.append(event)
+        if not q:
+            self._wake.clear()
+            # An event queued just before the clear saw the flag still set
+            # and skipped the wake callback; leave it pending for has_pending()
+            if q:
+                self._wake.set()
+        return [event for event in batch if event is not None] if latest else batch
     
     def process_queue(self, max_events: int = 100) -> int:
         """
         Process queued events. Call this from UI thread.
-        Returns number of events processed.
+        Returns number of events dispatched.
+        
+        Up to max_events are drained as one coalesced batch (see
+        drain_coalesced) and subscriber snapshots are resolved once per
+        event type, so dispatch cost is amortized.
         """
-        processed = 0
-        while processed < max_events:
-            try:
-                event = self._queue.get_nowait()
-                self.publish(event)
-                processed += 1
-            except queue.Empty:
-                break
-        return processed
+        batch = self.drain_coalesced(max_events)
+        
+        subscribers = self._subscribers
+        snapshots: dict[EventType, tuple[Callable, ...]] = {}
+        dead_types: set[EventType] = set()
+        for event in batch:
+            callbacks = snapshots.get(event.type)
+            if callbacks is None:
+                callbacks = snapshots[event.type] = subscribers.get(event.type, ())
+            if _dispatch(event, callbacks):
+                dead_types.add(event.type)
+            Event.release(event)
+        
+        for event_type in dead_types:
+            self._prune_dead(event_type)
+        return len(batch)
+    
+    def wait_for_events(self, timeout: float | None = None) -> bool:
+        """
+        Block until an event is queued or the timeout expires.
+        Returns True if events are pending.
+        """
+        return self._wake.wait(timeout) or bool(self._queue)
     
     def clear_queue(self) -> None:
         """Clear all queued events."""
-        while True:
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                break
+        self._queue.clear()
+        self._wake.clear()
     
     def emit_log(self, level: str, message: str, source: str = "") -> None:
         """Convenience method to emit log events."""
-        event_map = {
-            "info": EventType.LOG_INFO,
-            "warning": EventType.LOG_WARNING,
-            "error": EventType.LOG_ERROR,
-            "debug": EventType.LOG_DEBUG,
-        }
-        event_type = event_map.get(level.lower(), EventType.LOG_INFO)
-        self.publish_to_queue(Event(
+        event_type = _LEVEL_TO_EVENT.get(level.lower(), EventType.LOG_INFO)
+        # Skip building the event when nobody listens, like
+        # Logger.isEnabledFor(). Only debug is dropped: higher levels are
+        # kept for subscribers that attach later (e.g. startup plugin logs).
+        if event_type is EventType.LOG_DEBUG and not self.has_subscribers(event_type):
+            return
+        self.publish_to_queue(Event.acquire(
             type=event_type,
             payload={"message": message, "level": level},
             source=source
@@ -148,4 +339,4 @@ class EventBus:
 
 
 # Global event bus instance
-event_bus = EventBus()
+event_bus = EventBus._instance = EventBus()
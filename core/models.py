@@ -1,13 +1,27 @@
 """
 Core data models for the manga downloader application.
 """
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from operator import attrgetter
 from typing import Any, Optional
+import itertools
 import uuid
 import threading
 
 
+_chapter_number = attrgetter("number")
+
+# Task ids: a random per-process prefix plus a counter, unique within a run
+_task_id_prefix = uuid.uuid4().hex[:4]
+_task_id_counter = itertools.count()
+
+
+def _new_task_id() -> str:
+    return f"{_task_id_prefix}{next(_task_id_counter):04x}"
+
+
 class TaskStatus(Enum):
     """Task state machine states."""
     QUEUED = auto()
@@ -29,7 +43,7 @@ class FieldType(Enum):
     RANGE = "range"
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionField:
     """Describes a single option field for plugin UI."""
     key: str
@@ -44,7 +58,7 @@ class OptionField:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionsSchema:
     """Schema for plugin-defined options."""
     fields: list[OptionField] = field(default_factory=list)
@@ -54,7 +68,7 @@ class OptionsSchema:
         return {f.key: f.default for f in self.fields}
 
 
-@dataclass
+@dataclass(slots=True)
 class Chapter:
     """Represents a manga chapter."""
     id: str
@@ -66,7 +80,7 @@ class Chapter:
     page_count: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationTeam:
     """Represents a scanlation/translation group."""
     id: str
@@ -77,7 +91,7 @@ class TranslationTeam:
         return f"{self.name} [{self.language}]"
 
 
-@dataclass
+@dataclass(slots=True)
 class MangaInfo:
     """Metadata about a manga series fetched by a plugin."""
     title: str
@@ -90,17 +104,76 @@ class MangaInfo:
     chapters: list[Chapter] = field(default_factory=list)
     translation_teams: list[TranslationTeam] = field(default_factory=list)
     extra: dict[str, Any] = field(default_factory=dict)
+    # Lazily built, chapter-number ordered view of `chapters`
+    _sorted_chapters: Optional[list[Chapter]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _sorted_key: tuple[int, int] = field(
+        default=(0, -1), init=False, repr=False, compare=False
+    )
+    # (team_id, language) -> (chapters, numbers), None acting as a wildcard
+    _by_team_lang: dict[
+        tuple[Optional[str], Optional[str]], tuple[list[Chapter], list[float]]
+    ] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    @property
+    def sorted_chapters(self) -> list[Chapter]:
+        """
+        Chapters ordered by number.
+        
+        Rebuilt when `chapters` is replaced or changes length. In-place edits
+        that keep the length (e.g. `chapters[i] = other`) are not detected;
+        call invalidate_chapters() after those.
+        """
+        key = (id(self.chapters), len(self.chapters))
+        if self._sorted_chapters is None or self._sorted_key != key:
+            self._sorted_chapters = sorted(self.chapters, key=_chapter_number)
+            self._sorted_key = key
+            self._by_team_lang.clear()
+        return self._sorted_chapters
+    
+    def invalidate_chapters(self) -> None:
+        """Drop the cached chapter views after editing `chapters` in place."""
+        self._sorted_chapters = None
+        self._by_team_lang.clear()
+    
+    def chapters_for(self, selection: "UserSelection") -> list[Chapter]:
+        """
+        Return the chapters matching a selection, ordered by number.
+        
+        Chapters are bucketed by (team, language) on first use and each
+        bucket is range-sliced with bisect, so repeated selections against
+        the same team cost O(log n + k).
+        """
+        ordered = self.sorted_chapters
+        bucket_key = (selection.translation_team_id or None, selection.language or None)
+        bucket = self._by_team_lang.get(bucket_key)
+        if bucket is None:
+            team_id, language = bucket_key
+            chapters = [
+                ch for ch in ordered
+                if (team_id is None or ch.translation_team_id == team_id)
+                and (language is None or ch.language == language)
+            ]
+            bucket = self._by_team_lang[bucket_key] = (
+                chapters, [ch.number for ch in chapters]
+            )
+        
+        chapters, numbers = bucket
+        lo = 0 if selection.chapter_start is None else bisect_left(numbers, selection.chapter_start)
+        hi = len(numbers) if selection.chapter_end is None else bisect_right(numbers, selection.chapter_end)
+        return chapters[lo:hi]
     
     @property
     def chapter_range(self) -> tuple[float, float]:
         """Return (min_chapter, max_chapter) or (0, 0) if no chapters."""
         if not self.chapters:
             return (0.0, 0.0)
-        numbers = [c.number for c in self.chapters]
-        return (min(numbers), max(numbers))
+        ordered = self.sorted_chapters
+        return (ordered[0].number, ordered[-1].number)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSelection:
     """User's selection for downloading."""
     chapter_start: Optional[float] = None
@@ -109,22 +182,33 @@ class UserSelection:
     language: Optional[str] = None
     
     def chapters_in_range(self, chapters: list[Chapter]) -> list[Chapter]:
-        """Filter chapters to only those in the selected range."""
-        result = []
-        for ch in chapters:
-            if self.chapter_start is not None and ch.number < self.chapter_start:
-                continue
-            if self.chapter_end is not None and ch.number > self.chapter_end:
-                continue
-            if self.translation_team_id and ch.translation_team_id != self.translation_team_id:
-                continue
-            if self.language and ch.language != self.language:
-                continue
-            result.append(ch)
-        return sorted(result, key=lambda c: c.number)
-
-
-@dataclass
+        """
+        Filter chapters to only those in the selected range.
+        
+        The chapters are ordered by number (linear for already sorted input
+        such as MangaInfo.sorted_chapters), the range is cut out with bisect
+        and only that slice is filtered by team and language.
+        Prefer MangaInfo.chapters_for(), which also caches the team buckets.
+        """
+        ordered = sorted(chapters, key=_chapter_number)
+        lo = 0 if self.chapter_start is None else bisect_left(
+            ordered, self.chapter_start, key=_chapter_number
+        )
+        hi = len(ordered) if self.chapter_end is None else bisect_right(
+            ordered, self.chapter_end, key=_chapter_number
+        )
+        team_id = self.translation_team_id
+        language = self.language
+        if not team_id and not language:
+            return ordered[lo:hi]
+        return [
+            ch for ch in ordered[lo:hi]
+            if (not team_id or ch.translation_team_id == team_id)
+            and (not language or ch.language == language)
+        ]
+
+
+@dataclass(slots=True)
 class DownloadPlan:
     """Plan for downloading chapters, built by a plugin."""
     manga_title: str
@@ -141,37 +225,51 @@ class DownloadPlan:
 class CancelToken:
     """Thread-safe cancellation token for download tasks."""
     
+    # State bits
+    _CANCELLED = 1
+    _PAUSED = 2
+    
     def __init__(self):
-        self._cancelled = threading.Event()
-        self._paused = threading.Event()
+        # Packed state so check() is a single load and compare in the common case.
+        # Writes happen under the condition's lock; paused waiters block on it.
+        self._state = 0
+        self._cond = threading.Condition(threading.Lock())
     
     def cancel(self):
         """Request cancellation."""
-        self._cancelled.set()
+        with self._cond:
+            self._state |= self._CANCELLED
+            self._cond.notify_all()
     
     def pause(self):
         """Request pause."""
-        self._paused.set()
+        with self._cond:
+            self._state |= self._PAUSED
     
     def resume(self):
         """Resume from pause."""
-        self._paused.clear()
+        with self._cond:
+            self._state &= ~self._PAUSED
+            self._cond.notify_all()
     
     @property
     def is_cancelled(self) -> bool:
-        return self._cancelled.is_set()
+        return bool(self._state & self._CANCELLED)
     
     @property
     def is_paused(self) -> bool:
-        return self._paused.is_set()
+        return bool(self._state & self._PAUSED)
     
     def check(self) -> None:
         """Raise if cancelled, block if paused."""
-        if self._cancelled.is_set():
+        if not self._state:
+            return
+        if self._state & self._CANCELLED:
             raise CancelledException("Download was cancelled")
-        while self._paused.is_set() and not self._cancelled.is_set():
-            self._paused.wait(timeout=0.5)
-        if self._cancelled.is_set():
+        with self._cond:
+            while self._state == self._PAUSED:
+                self._cond.wait()
+        if self._state & self._CANCELLED:
             raise CancelledException("Download was cancelled")
 
 
@@ -180,10 +278,10 @@ class CancelledException(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a download task in the queue."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=_new_task_id)
     url: str = ""
     plugin_id: Optional[str] = None
     title: str = ""
@@ -199,6 +297,21 @@ class Task:
     selection: UserSelection = field(default_factory=UserSelection)
     options: dict[str, Any] = field(default_factory=dict)
     cancel_token: CancelToken = field(default_factory=CancelToken)
+    # Plan from the last download start, reused on resume while the inputs
+    # in download_plan_key (manga info, selection, options) are unchanged
+    download_plan: Optional[DownloadPlan] = field(default=None, repr=False, compare=False)
+    download_plan_key: Optional[tuple] = field(default=None, repr=False, compare=False)
+    
+    # Display text for every status except DOWNLOADING, which is formatted
+    _STATUS_TEXT = {
+        TaskStatus.QUEUED: "Queued",
+        TaskStatus.VALIDATING: "Validating...",
+        TaskStatus.READY: "Ready",
+        TaskStatus.PAUSED: "Paused",
+        TaskStatus.COMPLETED: "Completed",
+        TaskStatus.FAILED: "Failed",
+        TaskStatus.CANCELED: "Canceled",
+    }
     
     @property
     def display_title(self) -> str:
@@ -206,18 +319,19 @@ class Task:
     
     @property
     def status_text(self) -> str:
-        status_map = {
-            TaskStatus.QUEUED: "Queued",
-            TaskStatus.VALIDATING: "Validating...",
-            TaskStatus.READY: "Ready",
-            TaskStatus.DOWNLOADING: f"Downloading ({self.completed_chapters}/{self.total_chapters})",
-            TaskStatus.PAUSED: "Paused",
-            TaskStatus.COMPLETED: "Completed",
-            TaskStatus.FAILED: "Failed",
-            TaskStatus.CANCELED: "Canceled",
-        }
-        return status_map.get(self.status, str(self.status))
+        if self.status is TaskStatus.DOWNLOADING:
+            return f"Downloading ({self.completed_chapters}/{self.total_chapters})"
+        return Task._STATUS_TEXT.get(self.status) or str(self.status)
     
     @property
     def progress_percent(self) -> int:
         return int(self.progress * 100)
+    
+    def plan_inputs(self) -> tuple:
+        """Snapshot of everything a download plan is built from."""
+        s = self.selection
+        return (
+            self.manga_info,
+            s.chapter_start, s.chapter_end, s.translation_team_id, s.language,
+            tuple(self.options.items()),
+        )
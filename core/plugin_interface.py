@@ -3,8 +3,11 @@ Plugin interface definition.
 All plugins must implement this interface.
 """
 from abc import ABC, abstractmethod
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+from typing import Optional, Union
 import asyncio
+import time
 
 from .models import (
     MangaInfo,
@@ -17,6 +20,11 @@ from .models import (
 # Current plugin API version - plugins must match this
 PLUGIN_API_VERSION = 1
 
+# Shared executor for sync plugin calls, kept apart from the loop's default
+# executor so slow plugin I/O can't starve other run_in_executor users.
+# Threads are only started on first use.
+_SYNC_PLUGIN_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="plugin-sync")
+
 
 class PluginInterface(ABC):
     """
@@ -43,7 +51,7 @@ class PluginInterface(ABC):
         """Initialize the plugin."""
         self._enabled = True
     
-    @property
+    @cached_property
     def id(self) -> str:
         """Unique identifier for this plugin."""
         return f"{self.name.lower().replace(' ', '_')}_{self.version}"
@@ -76,6 +84,10 @@ class PluginInterface(ABC):
         """
         Normalize/clean a URL to a canonical form.
         
+        Called for every URL added to the queue, so keep it cheap: no
+        network access, and compile any regex once at class scope rather
+        than per call.
+        
         Args:
             url: The URL to normalize
             
@@ -158,6 +170,10 @@ class PluginInterface(ABC):
             plan: The download plan to execute
             progress_callback: Callback for progress updates
                 Signature: callback(chapter_num, page_num, total_pages, bytes_downloaded, speed_str)
+                page_num is the number of pages of that chapter done so far.
+                Cheap and non-blocking: it updates the task and queues a
+                throttled event that the GUI drains on its own timer, so it
+                is safe to call for every page.
             cancel_token: Token to check for cancellation/pause
             
         Raises:
@@ -195,6 +211,13 @@ class PluginInterface(ABC):
     def cleanup(self) -> None:
         """Called when plugin is unloaded. Clean up resources."""
         pass
+    
+    async def aclose(self) -> None:
+        """
+        Called on the download loop when the app shuts down.
+        Close async resources such as HTTP clients here.
+        """
+        pass
 
 
 class SyncPluginWrapper:
@@ -203,9 +226,55 @@ class SyncPluginWrapper:
     Use this if your plugin uses synchronous networking (requests).
     """
     
-    def __init__(self, sync_method: callable):
+    def __init__(self, sync_method: callable, executor: Optional[ThreadPoolExecutor] = None):
         self.sync_method = sync_method
+        self._executor = executor or _SYNC_PLUGIN_EXECUTOR
     
     async def __call__(self, *args, **kwargs):
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self.sync_method(*args, **kwargs))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(self.sync_method, *args, **kwargs)
+        )
+
+
+class RateLimiter:
+    """
+    Async token bucket for spacing out a plugin's requests.
+    
+    Allows one request per `interval` seconds on average, with up to `burst`
+    requests let through back to back. Unlike sleeping after every request,
+    callers can run concurrently and only wait when the bucket is empty.
+    
+    Usage:
+        async with self._rate_limiter:
+            response = await client.get(url)
+    """
+    
+    def __init__(self, interval: float, burst: int = 1):
+        self.interval = interval
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a request is allowed."""
+        if self.interval <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) / self.interval)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) * self.interval)
+            self._tokens = 0.0
+            self._updated = time.monotonic()
+    
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        pass
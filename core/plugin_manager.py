@@ -1,16 +1,35 @@
 """
 Plugin manager for discovering, loading, and managing plugins.
 """
+import importlib.machinery
 import importlib.util
 import sys
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlparse
 import traceback
 
 from .plugin_interface import PluginInterface, PLUGIN_API_VERSION
 from .event_bus import EventBus, Event, EventType
 
 
+class _PluginTables:
+    """
+    The lookup maps built by one discovery pass.
+    A pass fills a fresh set, which is then swapped in one map at a time
+    (see PluginManager._install), so readers never see a map being filled.
+    """
+    
+    __slots__ = ("plugins", "domain_to_plugin", "loaded_files", "display_text", "load_errors")
+    
+    def __init__(self):
+        self.plugins: dict[str, PluginInterface] = {}
+        self.domain_to_plugin: dict[str, PluginInterface] = {}
+        self.loaded_files: dict[Path, tuple[int, str]] = {}
+        self.display_text: dict[str, tuple[str, str]] = {}
+        self.load_errors: dict[str, Exception] = {}
+
+
 class PluginManager:
     """
     Manages plugin discovery, loading, and lifecycle.
@@ -25,48 +44,96 @@ class PluginManager:
         """
         self.plugins_dir = plugins_dir
         self.plugins: dict[str, PluginInterface] = {}
-        self.load_errors: dict[str, str] = {}
-        self.event_bus = EventBus()
+        # Hostname (without "www.") -> first plugin that declared it
+        self._domain_to_plugin: dict[str, PluginInterface] = {}
+        # Plugin name -> exception raised while loading (format with format_load_error)
+        self.load_errors: dict[str, Exception] = {}
+        # Plugin file -> (mtime_ns, plugin_id), used to skip unchanged files on reload
+        self._loaded_files: dict[Path, tuple[int, str]] = {}
+        # Plugin id -> (domains text, API version text) for get_plugin_info,
+        # built once when the plugin is registered
+        self._display_text: dict[str, tuple[str, str]] = {}
+        # Bumped whenever the plugin list or an enabled state changes, so
+        # views can skip redrawing an unchanged list
+        self.revision = 0
+        self.event_bus = EventBus.instance()
         
         # Create plugins directory if it doesn't exist
         self.plugins_dir.mkdir(parents=True, exist_ok=True)
     
-    def discover_and_load(self) -> int:
+    def discover_and_load(self, keep: Optional[dict[Path, PluginInterface]] = None) -> int:
         """
         Discover and load all plugins from the plugins directory.
         
+        Args:
+            keep: Already-loaded plugins by file path; these are reused as-is
+                instead of being imported again
+        
         Returns:
             Number of successfully loaded plugins
         """
-        self.plugins.clear()
-        self.load_errors.clear()
-        
+        tables = self._discover(keep or {})
+        self._install(tables)
+        return len(tables.plugins)
+    
+    def _discover(self, keep: dict[Path, PluginInterface]) -> _PluginTables:
+        """
+        Import the plugins into a fresh set of tables.
+        Touches no live state, so it is safe to run off the GUI thread.
+        """
+        tables = _PluginTables()
         if not self.plugins_dir.exists():
             self.event_bus.emit_log("warning", f"Plugins directory not found: {self.plugins_dir}")
-            return 0
+            return tables
         
-        loaded = 0
+        for plugin_file, plugin_name in self._find_plugin_files():
+            plugin = keep.get(plugin_file)
+            if plugin is not None:
+                self._register_plugin(tables, plugin, plugin_file)
+            else:
+                self._load_plugin(tables, plugin_file, plugin_name)
         
-        # Look for plugin directories (each plugin is a package)
+        self.event_bus.emit_log("info", f"Loaded {len(tables.plugins)} plugin(s)")
+        return tables
+    
+    def _install(self, tables: _PluginTables) -> None:
+        """Make a discovered set of tables the live one."""
+        self.plugins = tables.plugins
+        self._domain_to_plugin = tables.domain_to_plugin
+        self._loaded_files = tables.loaded_files
+        self._display_text = tables.display_text
+        self.load_errors = tables.load_errors
+        self.revision += 1
+    
+    def _find_plugin_files(self) -> list[tuple[Path, str]]:
+        """Return (plugin_file, module_name) for every plugin in the plugins directory."""
+        found = []
         for item in self.plugins_dir.iterdir():
+            # Look for plugin directories (each plugin is a package)
             if item.is_dir() and not item.name.startswith("_"):
                 plugin_file = item / "plugin.py"
                 if plugin_file.exists():
-                    if self._load_plugin(plugin_file, item.name):
-                        loaded += 1
+                    found.append((plugin_file, item.name))
             # Also support single-file plugins
             elif item.is_file() and item.suffix == ".py" and not item.name.startswith("_"):
-                if self._load_plugin(item, item.stem):
-                    loaded += 1
-        
-        self.event_bus.emit_log("info", f"Loaded {loaded} plugin(s)")
-        return loaded
+                found.append((item, item.stem))
+        return found
+    
+    def _register_plugin(self, tables: _PluginTables, plugin: PluginInterface, plugin_path: Path) -> None:
+        """Add a plugin instance to a set of tables for lookup and dispatch."""
+        tables.display_text[plugin.id] = (
+            self._format_domains(plugin.supported_domains), str(plugin.PLUGIN_API_VERSION)
+        )
+        tables.loaded_files[plugin_path] = (plugin_path.stat().st_mtime_ns, plugin.id)
+        self._register_domains(tables, plugin)
+        tables.plugins[plugin.id] = plugin
     
-    def _load_plugin(self, plugin_path: Path, plugin_name: str) -> bool:
+    def _load_plugin(self, tables: _PluginTables, plugin_path: Path, plugin_name: str) -> bool:
         """
         Load a single plugin from a file.
         
         Args:
+            tables: Tables to register the plugin (or its load error) in
             plugin_path: Path to the plugin file
             plugin_name: Name for the plugin module
             
@@ -74,10 +141,12 @@ class PluginManager:
             True if successfully loaded
         """
         try:
-            # Load the module
+            # Load the module; SourceFileLoader reuses the __pycache__ bytecode
+            module_name = f"plugins.{plugin_name}"
             spec = importlib.util.spec_from_file_location(
-                f"plugins.{plugin_name}",
-                plugin_path
+                module_name,
+                plugin_path,
+                loader=importlib.machinery.SourceFileLoader(module_name, str(plugin_path))
             )
             if spec is None or spec.loader is None:
                 raise ImportError(f"Could not load spec for {plugin_path}")
@@ -87,15 +156,7 @@ class PluginManager:
             spec.loader.exec_module(module)
             
             # Find the plugin class
-            plugin_class = None
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (isinstance(attr, type) and 
-                    issubclass(attr, PluginInterface) and 
-                    attr is not PluginInterface):
-                    plugin_class = attr
-                    break
-            
+            plugin_class = self._find_plugin_class(module)
             if plugin_class is None:
                 raise ImportError(f"No PluginInterface subclass found in {plugin_path}")
             
@@ -114,8 +175,8 @@ class PluginManager:
             plugin = plugin_class()
             plugin_id = plugin.id
             
-            self.plugins[plugin_id] = plugin
-            self.event_bus.publish_to_queue(Event(
+            self._register_plugin(tables, plugin, plugin_path)
+            self.event_bus.publish_to_queue(Event.acquire(
                 type=EventType.PLUGIN_LOADED,
                 payload={"plugin_id": plugin_id, "name": plugin.name}
             ))
@@ -123,15 +184,66 @@ class PluginManager:
             return True
             
         except Exception as e:
-            error_msg = f"{type(e).__name__}: {e}\n{traceback.format_exc()}"
-            self.load_errors[plugin_name] = error_msg
-            self.event_bus.publish_to_queue(Event(
+            tables.load_errors[plugin_name] = e
+            self.event_bus.publish_to_queue(Event.acquire(
                 type=EventType.PLUGIN_ERROR,
                 payload={"plugin_name": plugin_name, "error": str(e)}
             ))
             self.event_bus.emit_log("error", f"Failed to load plugin {plugin_name}: {e}")
             return False
     
+    @staticmethod
+    def _find_plugin_class(module) -> Optional[type[PluginInterface]]:
+        """
+        Find the PluginInterface subclass exported by a plugin module.
+        
+        A class named `Plugin` or the names in `__all__` are checked first;
+        otherwise the module namespace is scanned in definition order.
+        """
+        def is_plugin_class(obj) -> bool:
+            return (isinstance(obj, type) and
+                    issubclass(obj, PluginInterface) and
+                    obj is not PluginInterface)
+        
+        namespace = vars(module)
+        candidates = [namespace.get("Plugin")]
+        candidates.extend(namespace.get(name) for name in namespace.get("__all__", ()))
+        for obj in candidates:
+            if is_plugin_class(obj):
+                return obj
+        
+        for obj in list(namespace.values()):
+            if is_plugin_class(obj):
+                return obj
+        return None
+    
+    def format_load_error(self, plugin_name: str) -> str:
+        """Format the load error for a plugin, including its traceback."""
+        error = self.load_errors.get(plugin_name)
+        if error is None:
+            return ""
+        trace = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+        return f"{type(error).__name__}: {error}\n{trace}"
+    
+    @staticmethod
+    def _normalize_host(host: str) -> str:
+        """Lowercase a hostname and strip a leading "www."."""
+        host = host.lower()
+        return host[4:] if host.startswith("www.") else host
+    
+    @staticmethod
+    def _format_domains(domains: list[str]) -> str:
+        """Show up to three domains, then a count of the rest."""
+        text = ", ".join(domains[:3])
+        if len(domains) > 3:
+            text += f" (+{len(domains) - 3} more)"
+        return text
+    
+    def _register_domains(self, tables: _PluginTables, plugin: PluginInterface) -> None:
+        """Index a plugin by its supported domains for fast URL dispatch."""
+        for domain in plugin.supported_domains:
+            tables.domain_to_plugin.setdefault(self._normalize_host(domain), plugin)
+    
     def get_plugin(self, plugin_id: str) -> Optional[PluginInterface]:
         """Get a plugin by its ID."""
         return self.plugins.get(plugin_id)
@@ -146,6 +258,19 @@ class PluginManager:
         Returns:
             The first matching enabled plugin, or None
         """
+        try:
+            host = urlparse(url).hostname
+        except ValueError:
+            host = None
+        # Probe the host, then each parent domain, against the index
+        host = self._normalize_host(host) if host else ""
+        while host:
+            plugin = self._domain_to_plugin.get(host)
+            if plugin is not None and plugin.enabled and plugin.can_handle(url):
+                return plugin
+            _, _, host = host.partition(".")
+        
+        # Fall back to asking every plugin (custom matching)
         for plugin in self.plugins.values():
             if plugin.enabled and plugin.can_handle(url):
                 return plugin
@@ -163,7 +288,8 @@ class PluginManager:
         """Enable a plugin."""
         if plugin_id in self.plugins:
             self.plugins[plugin_id].enabled = True
-            self.event_bus.publish_to_queue(Event(
+            self.revision += 1
+            self.event_bus.publish_to_queue(Event.acquire(
                 type=EventType.PLUGIN_ENABLED,
                 payload={"plugin_id": plugin_id}
             ))
@@ -174,7 +300,8 @@ class PluginManager:
         """Disable a plugin."""
         if plugin_id in self.plugins:
             self.plugins[plugin_id].enabled = False
-            self.event_bus.publish_to_queue(Event(
+            self.revision += 1
+            self.event_bus.publish_to_queue(Event.acquire(
                 type=EventType.PLUGIN_DISABLED,
                 payload={"plugin_id": plugin_id}
             ))
@@ -182,20 +309,61 @@ class PluginManager:
         return False
     
     def reload_plugins(self) -> int:
-        """Reload all plugins."""
-        # Cleanup existing plugins
-        for plugin in self.plugins.values():
+        """
+        Reload all plugins.
+        
+        Plugins whose plugin file is unchanged (same mtime) are kept
+        without being imported again; only new or modified files are loaded.
+        """
+        return self.finish_reload(self.prepare_reload())
+    
+    def prepare_reload(self) -> _PluginTables:
+        """
+        First half of reload_plugins(): import new and modified plugins
+        into fresh tables. Live state is only read, so this can run on a
+        worker thread while the GUI keeps using the current plugins.
+        Pass the result to finish_reload() on the GUI thread.
+        """
+        plugins = self.plugins
+        unchanged: dict[Path, PluginInterface] = {}
+        for plugin_path, (mtime_ns, plugin_id) in self._loaded_files.items():
+            plugin = plugins.get(plugin_id)
+            try:
+                current_mtime = plugin_path.stat().st_mtime_ns
+            except OSError:
+                continue
+            if plugin is not None and current_mtime == mtime_ns:
+                unchanged[plugin_path] = plugin
+        return self._discover(unchanged)
+    
+    def finish_reload(self, tables: _PluginTables) -> int:
+        """
+        Second half of reload_plugins(): swap in the prepared tables and
+        clean up the plugins they replace or drop.
+        
+        Returns:
+            Number of loaded plugins
+        """
+        old_plugins = self.plugins
+        self._install(tables)
+        
+        kept = {id(p) for p in tables.plugins.values()}
+        for plugin in old_plugins.values():
+            if id(plugin) in kept:
+                continue
             try:
                 plugin.cleanup()
             except Exception as e:
                 self.event_bus.emit_log("warning", f"Error cleaning up plugin: {e}")
         
-        return self.discover_and_load()
+        return len(tables.plugins)
     
     def get_plugin_info(self) -> list[dict]:
         """Get info about all plugins for display."""
         info = []
+        display_text = self._display_text
         for plugin_id, plugin in self.plugins.items():
+            domains_display, api_version_display = display_text[plugin_id]
             info.append({
                 "id": plugin_id,
                 "name": plugin.name,
@@ -205,5 +373,7 @@ class PluginManager:
                 "domains": plugin.supported_domains,
                 "enabled": plugin.enabled,
                 "api_version": plugin.PLUGIN_API_VERSION,
+                "domains_display": domains_display,
+                "api_version_display": api_version_display,
             })
         return info
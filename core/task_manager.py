@@ -2,16 +2,26 @@
 Task manager for managing the download queue and executing downloads.
 """
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Callable
 import threading
 import time
 
+import httpx
+
 from .models import Task, TaskStatus, UserSelection, CancelToken, CancelledException
 from .plugin_manager import PluginManager
 from .event_bus import EventBus, Event, EventType
 
 
+# Minimum seconds between progress events for a single task
+PROGRESS_EMIT_INTERVAL = 0.1
+
+# Finished states, listed by get_history_tasks()
+HISTORY_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELED})
+
+
 class TaskManager:
     """
     Manages the download task queue and executes downloads.
@@ -28,16 +38,24 @@ class TaskManager:
         """
         self.plugin_manager = plugin_manager
         self.settings = settings
-        self.event_bus = EventBus()
+        self.event_bus = EventBus.instance()
         
-        self.tasks: dict[str, Task] = {}
-        self.task_order: list[str] = []  # Maintain insertion order
+        self.tasks: dict[str, Task] = {}  # Insertion ordered
+        # Finished tasks in the order they finished, kept in step with status
+        # changes by _emit_task_update so history views don't scan every task
+        self._history: dict[str, Task] = {}
+        # Bumped when a task is added, removed or updated, so views can
+        # skip redrawing unchanged task lists
+        self.revision = 0
         
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._worker_thread: Optional[threading.Thread] = None
+        # Set once the worker loop is ready to accept coroutines
+        self._loop_ready = threading.Event()
         self._running = False
         self._active_downloads = 0
         self._download_semaphore: Optional[asyncio.Semaphore] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
     
     def start(self) -> None:
         """Start the background worker thread."""
@@ -51,23 +69,73 @@ class TaskManager:
     def stop(self) -> None:
         """Stop the background worker thread."""
         self._running = False
-        if self._loop:
+        if self._loop_ready.is_set():
+            # Close pooled connections on the loop that owns them
+            closing = asyncio.run_coroutine_threadsafe(self._close_clients(), self._loop)
+            try:
+                closing.result(timeout=2)
+            except Exception:
+                pass
             self._loop.call_soon_threadsafe(self._loop.stop)
         if self._worker_thread:
             self._worker_thread.join(timeout=5)
     
+    async def _close_clients(self) -> None:
+        """Close the shared HTTP client and let plugins close theirs."""
+        closers = [plugin.aclose() for plugin in self.plugin_manager.get_all_plugins()]
+        if self._http_client is not None:
+            closers.append(self._http_client.aclose())
+        await asyncio.gather(*closers, return_exceptions=True)
+    
     def _run_event_loop(self) -> None:
-        """Run the asyncio event loop in a background thread."""
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
+        """
+        Run the asyncio event loop in a background thread.
         
-        max_parallel = self.settings.get("max_parallel_downloads", 3)
+        The Runner cancels leftover tasks and shuts down the executor when
+        the loop stops.
+        """
+        with asyncio.Runner() as runner:
+            self._loop = runner.get_loop()
+            # Sized for plugins offloading file writes with asyncio.to_thread
+            self._loop.set_default_executor(ThreadPoolExecutor(
+                max_workers=self.settings.get("io_threads", 32),
+                thread_name_prefix="download-io"
+            ))
+            self._setup_loop_state()
+            self._loop_ready.set()
+            try:
+                self._loop.run_forever()
+            finally:
+                self._loop_ready.clear()
+        self._loop = None
+    
+    def _setup_loop_state(self) -> None:
+        """Create the objects that belong to the worker loop."""
+        max_parallel = self.settings.get("max_parallel_downloads", 16)
         self._download_semaphore = asyncio.Semaphore(max_parallel)
         
-        try:
-            self._loop.run_forever()
-        finally:
-            self._loop.close()
+        # One connection pool shared by every task, handed to plugins via the plan
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            timeout=self.settings.get("timeout", 30),
+            follow_redirects=True,
+        )
+    
+    def set_max_parallel(self, count: int) -> None:
+        """
+        Change how many downloads may run at once.
+        
+        In-flight downloads keep the permit they hold on the old semaphore;
+        downloads started afterwards are limited by the new one.
+        """
+        self.settings["max_parallel_downloads"] = count
+        if self._loop_ready.is_set():
+            self._loop.call_soon_threadsafe(self._replace_semaphore, count)
+    
+    def _replace_semaphore(self, count: int) -> None:
+        """Swap in a new download semaphore (runs on the worker loop)."""
+        self._download_semaphore = asyncio.Semaphore(count)
     
     def add_task(self, url: str) -> Task:
         """
@@ -79,6 +147,17 @@ class TaskManager:
         Returns:
             The created Task
         """
+        task = self._create_task(url)
+        
+        self.event_bus.publish_to_queue(Event.acquire(
+            type=EventType.TASK_ADDED,
+            payload={"task_id": task.id, "url": task.url}
+        ))
+        
+        return task
+    
+    def _create_task(self, url: str) -> Task:
+        """Create and store a task, matching it to a plugin."""
         task = Task(url=url.strip())
         
         # Try to find a matching plugin
@@ -88,13 +167,7 @@ class TaskManager:
             task.url = plugin.normalize_url(task.url)
         
         self.tasks[task.id] = task
-        self.task_order.append(task.id)
-        
-        self.event_bus.publish_to_queue(Event(
-            type=EventType.TASK_ADDED,
-            payload={"task_id": task.id, "url": task.url}
-        ))
-        
+        self.revision += 1
         return task
     
     def add_tasks_from_text(self, text: str) -> list[Task]:
@@ -106,12 +179,24 @@ class TaskManager:
             
         Returns:
             List of created Tasks
+        
+        A single TASK_ADDED event is published for the whole batch, with
+        "task_ids" and "urls" lists in its payload.
         """
-        tasks = []
-        for line in text.strip().split("\n"):
-            line = line.strip()
-            if line and not line.startswith("#"):
-                tasks.append(self.add_task(line))
+        create = self._create_task
+        tasks = [
+            create(line)
+            for line in map(str.strip, text.splitlines())
+            if line and not line.startswith("#")
+        ]
+        if tasks:
+            self.event_bus.publish_to_queue(Event.acquire(
+                type=EventType.TASK_ADDED,
+                payload={
+                    "task_ids": [task.id for task in tasks],
+                    "urls": [task.url for task in tasks],
+                }
+            ))
         return tasks
     
     def remove_task(self, task_id: str) -> bool:
@@ -126,9 +211,10 @@ class TaskManager:
             task.cancel_token.cancel()
         
         del self.tasks[task_id]
-        self.task_order.remove(task_id)
+        self._history.pop(task_id, None)
+        self.revision += 1
         
-        self.event_bus.publish_to_queue(Event(
+        self.event_bus.publish_to_queue(Event.acquire(
             type=EventType.TASK_REMOVED,
             payload={"task_id": task_id}
         ))
@@ -141,14 +227,15 @@ class TaskManager:
     
     def get_all_tasks(self) -> list[Task]:
         """Get all tasks in order."""
-        return [self.tasks[tid] for tid in self.task_order if tid in self.tasks]
+        return list(self.tasks.values())
+    
+    def get_history_tasks(self) -> list[Task]:
+        """Get completed/failed/canceled tasks in the order they finished."""
+        return list(self._history.values())
     
     def clear_completed(self) -> int:
         """Remove all completed/failed/canceled tasks. Returns count removed."""
-        to_remove = [
-            tid for tid, task in self.tasks.items()
-            if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELED)
-        ]
+        to_remove = list(self._history)
         for tid in to_remove:
             self.remove_task(tid)
         return len(to_remove)
@@ -162,7 +249,8 @@ class TaskManager:
         if not task:
             return
         
-        if not self._loop:
+        # The worker may still be starting up right after start()
+        if not self._loop_ready.wait(timeout=2):
             self.event_bus.emit_log("error", "Worker thread not running")
             return
         
@@ -221,7 +309,8 @@ class TaskManager:
         if task.status not in (TaskStatus.READY, TaskStatus.PAUSED, TaskStatus.QUEUED):
             return
         
-        if not self._loop:
+        # The worker may still be starting up right after start()
+        if not self._loop_ready.wait(timeout=2):
             self.event_bus.emit_log("error", "Worker thread not running")
             return
         
@@ -249,25 +338,61 @@ class TaskManager:
                     task.manga_info = await plugin.fetch_manga_info(task.url)
                     task.title = task.manga_info.title
                 
-                # Build download plan
-                download_plan = await plugin.build_download_plan(
-                    task.url,
-                    task.manga_info,
-                    task.selection,
-                    task.options
-                )
+                # Build download plan, or reuse it if nothing changed since
+                # the last start (e.g. on resume)
+                plan_key = task.plan_inputs()
+                download_plan = task.download_plan
+                if download_plan is None or task.download_plan_key != plan_key:
+                    download_plan = await plugin.build_download_plan(
+                        task.url,
+                        task.manga_info,
+                        task.selection,
+                        task.options
+                    )
+                    task.download_plan = download_plan
+                    task.download_plan_key = plan_key
                 download_plan.output_dir = self.settings.get("download_folder", "./downloads")
+                download_plan.extra["http_client"] = self._http_client
                 
                 task.total_chapters = download_plan.total_chapters
                 self._emit_task_update(task)
                 
-                self.event_bus.publish_to_queue(Event(
+                self.event_bus.publish_to_queue(Event.acquire(
                     type=EventType.DOWNLOAD_STARTED,
                     payload={"task_id": task.id, "title": task.title}
                 ))
                 
-                # Track last chapter to detect chapter completion
-                last_chapter_num = [None]  # Use list to allow modification in nested function
+                # Per-chapter completed fraction and their running sum. Keyed by
+                # chapter so plugins may download several chapters at once.
+                chapter_fractions: dict[float, float] = {}
+                fraction_sum = [0.0]  # Use list to allow modification in nested function
+                task.completed_chapters = 0
+                last_emit_ts = [0.0]
+                
+                # Reciprocals so the per-page progress math is multiply-only;
+                # the page one is refreshed whenever a chapter's page count changes
+                inv_total_chapters = 1.0 / max(task.total_chapters, 1)
+                page_scale = [0, 1.0]  # [total_pages, 1 / total_pages]
+                
+                # One payload per task, updated in place for every emit. The
+                # queue coalesces progress per task, so consumers only ever
+                # act on the newest values and never need their own copy.
+                progress_payload = {
+                    "task_id": task.id,
+                    "status": task.status.name,
+                    "title": task.title,
+                    "chapter": None,
+                    "page": 0,
+                    "total_pages": 0,
+                    "speed": "",
+                    "progress": 0.0,
+                }
+                
+                # Bound once so the per-page callback reads locals instead of
+                # repeating attribute and global lookups
+                publish = self.event_bus.publish_to_queue
+                acquire_event = Event.acquire
+                progress_event_type = EventType.DOWNLOAD_PROGRESS
                 
                 # Create progress callback
                 def progress_callback(
@@ -277,36 +402,45 @@ class TaskManager:
                     bytes_downloaded: int,
                     speed_str: str
                 ):
-                    # Detect chapter change (new chapter started = previous chapter completed)
-                    if last_chapter_num[0] is not None and chapter_num != last_chapter_num[0]:
-                        task.completed_chapters += 1
-                    last_chapter_num[0] = chapter_num
-                    
-                    # Also mark complete when we finish the last page of a chapter
-                    if page_num == total_pages and chapter_num == last_chapter_num[0]:
-                        # This is the last page of the current chapter
-                        pass  # Will be counted when next chapter starts or download ends
-                    
                     task.current_chapter = str(chapter_num)
                     task.speed = speed_str
                     
+                    # Update this chapter's fraction; a chapter counts as
+                    # completed once its last page is reported
+                    if total_pages != page_scale[0]:
+                        page_scale[0] = total_pages
+                        page_scale[1] = 1.0 / max(total_pages, 1)
+                    fraction = page_num * page_scale[1]
+                    previous = chapter_fractions.get(chapter_num, 0.0)
+                    chapter_fractions[chapter_num] = fraction
+                    fraction_sum[0] += fraction - previous
+                    if fraction >= 1.0 > previous:
+                        task.completed_chapters += 1
+                    elif previous >= 1.0 > fraction:
+                        task.completed_chapters -= 1
+                    
                     # Calculate overall progress
-                    chapter_progress = page_num / max(total_pages, 1)
-                    overall = (task.completed_chapters + chapter_progress) / max(task.total_chapters, 1)
-                    task.progress = min(overall, 1.0)
+                    overall = fraction_sum[0] * inv_total_chapters
+                    task.progress = overall if overall < 1.0 else 1.0
                     
-                    self._emit_task_update(task)
+                    # Throttle emits per task; the task fields above stay current
+                    # so the next emit carries fresh values. Always emit the last page.
+                    now = time.monotonic()
+                    if now - last_emit_ts[0] < PROGRESS_EMIT_INTERVAL and page_num != total_pages:
+                        return
+                    last_emit_ts[0] = now
                     
-                    self.event_bus.publish_to_queue(Event(
-                        type=EventType.DOWNLOAD_PROGRESS,
-                        payload={
-                            "task_id": task.id,
-                            "chapter": chapter_num,
-                            "page": page_num,
-                            "total_pages": total_pages,
-                            "speed": speed_str,
-                            "progress": task.progress
-                        }
+                    # One event carries both progress and task state, replacing
+                    # the separate TASK_UPDATED
+                    progress_payload["status"] = task.status.name
+                    progress_payload["chapter"] = chapter_num
+                    progress_payload["page"] = page_num
+                    progress_payload["total_pages"] = total_pages
+                    progress_payload["speed"] = speed_str
+                    progress_payload["progress"] = task.progress
+                    publish(acquire_event(
+                        type=progress_event_type,
+                        payload=progress_payload
                     ))
                 
                 # Execute download
@@ -316,16 +450,12 @@ class TaskManager:
                     task.cancel_token
                 )
                 
-                # Count the last chapter as completed
-                if last_chapter_num[0] is not None:
-                    task.completed_chapters += 1
-                
                 task.status = TaskStatus.COMPLETED
                 task.progress = 1.0
                 task.completed_chapters = task.total_chapters  # Ensure it shows complete
                 self._emit_task_update(task)
                 
-                self.event_bus.publish_to_queue(Event(
+                self.event_bus.publish_to_queue(Event.acquire(
                     type=EventType.DOWNLOAD_COMPLETE,
                     payload={"task_id": task.id, "title": task.title}
                 ))
@@ -341,7 +471,7 @@ class TaskManager:
                 task.errors.append(str(e))
                 self._emit_task_update(task)
                 
-                self.event_bus.publish_to_queue(Event(
+                self.event_bus.publish_to_queue(Event.acquire(
                     type=EventType.DOWNLOAD_ERROR,
                     payload={"task_id": task.id, "error": str(e)}
                 ))
@@ -372,7 +502,13 @@ class TaskManager:
     
     def _emit_task_update(self, task: Task) -> None:
         """Emit a task update event."""
-        self.event_bus.publish_to_queue(Event(
+        self.revision += 1
+        if task.status in HISTORY_STATUSES:
+            self._history.setdefault(task.id, task)
+        else:
+            # Re-validated or restarted
+            self._history.pop(task.id, None)
+        self.event_bus.publish_to_queue(Event.acquire(
             type=EventType.TASK_UPDATED,
             payload={
                 "task_id": task.id,
@@ -8,6 +8,7 @@ architecture for supporting multiple websites.
 Usage:
     python main.py
 """
+import os
 import sys
 from pathlib import Path
 
@@ -20,7 +21,7 @@ from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont, QFontDatabase
 
 from core import PluginManager, TaskManager, EventBus
-from ui import MainWindow
+from ui import MainWindow, apply_styles
 
 
 def setup_high_dpi():
@@ -32,9 +33,15 @@ def setup_high_dpi():
 def load_fonts():
     """Load custom fonts if available."""
     fonts_dir = PROJECT_ROOT / "assets" / "fonts"
-    if fonts_dir.exists():
-        for font_file in fonts_dir.glob("*.ttf"):
-            QFontDatabase.addApplicationFont(str(font_file))
+    # One scandir pass; entry names and types come from the listing itself
+    try:
+        entries = os.scandir(fonts_dir)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.endswith(".ttf") and entry.is_file():
+                QFontDatabase.addApplicationFont(entry.path)
 
 
 def main():
@@ -55,10 +62,13 @@ def main():
     # Load custom fonts
     load_fonts()
     
+    # Stylesheet is parsed once, for the whole application
+    apply_styles(app)
+    
     # Initialize settings
     settings = {
         "download_folder": str(Path.home() / "Downloads" / "MangaDL"),
-        "max_parallel_downloads": 3,
+        "max_parallel_downloads": 16,
         "retry_count": 3,
         "timeout": 30,
         "rate_limit": 0.5,
@@ -4,7 +4,7 @@ Handles example.com URLs and simulates manga downloads.
 
 This is a reference implementation showing:
 - URL matching and normalization
-- Async metadata fetching with httpx
+- Async metadata fetching
 - Options schema for UI generation
 - Download with progress callbacks
 """
@@ -14,15 +14,33 @@ import re
 from pathlib import Path
 from urllib.parse import urlparse
 
-import httpx
-
-from core.plugin_interface import PluginInterface, PLUGIN_API_VERSION
+from core.plugin_interface import PluginInterface, RateLimiter, PLUGIN_API_VERSION
+from core.event_bus import EventBus, EventType
 from core.models import (
     MangaInfo, Chapter, TranslationTeam,
     UserSelection, DownloadPlan, OptionsSchema,
     OptionField, FieldType, CancelToken
 )
 
+# Characters not allowed in file and folder names
+_INVALID_FN_CHARS = re.compile(r'[<>:"/\\|?*]')
+
+# Seconds between refreshes of the displayed download speed
+SPEED_REFRESH_INTERVAL = 0.25
+
+# (divisor, format) indexed by the number of thresholds (1 KB, 1 MB) reached
+_SPEED_FORMATS = (
+    (1, "%.0f B/s"),
+    (1_000, "%.1f KB/s"),
+    (1_000_000, "%.1f MB/s"),
+)
+
+
+def _bulk_mkdir(dirs: list[Path]) -> None:
+    """Create each directory (and parents) if missing."""
+    for d in dirs:
+        d.mkdir(parents=True, exist_ok=True)
+
 
 class ExamplePlugin(PluginInterface):
     """
@@ -45,19 +63,10 @@ class ExamplePlugin(PluginInterface):
     
     def __init__(self):
         super().__init__()
-        self._client: httpx.AsyncClient | None = None
-    
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers={
-                    "User-Agent": "MangaDL/1.0 (Example Plugin)"
-                }
-            )
-        return self._client
+        self._rate_limiter = RateLimiter(self.rate_limit)
+        self._domain_set = frozenset(
+            d.lower().removeprefix("www.") for d in self.supported_domains
+        )
     
     def can_handle(self, url: str) -> bool:
         """Check if this plugin can handle the URL."""
@@ -68,10 +77,13 @@ class ExamplePlugin(PluginInterface):
             if domain.startswith("www."):
                 domain = domain[4:]
             
-            return any(
-                domain == d or domain.endswith("." + d)
-                for d in self.supported_domains
-            )
+            # Probe the domain and each parent suffix against the set
+            domains = self._domain_set
+            while domain:
+                if domain in domains:
+                    return True
+                _, _, domain = domain.partition(".")
+            return False
         except Exception:
             return False
     
@@ -201,12 +213,22 @@ class ExamplePlugin(PluginInterface):
                 default=True,
                 description="Download chapter cover images"
             ),
+            OptionField(
+                key="concurrent_pages",
+                label="Concurrent Pages",
+                field_type=FieldType.NUMBER,
+                default=8,
+                min_value=1,
+                max_value=16,
+                step=1,
+                description="Pages to download in parallel per chapter"
+            ),
             OptionField(
                 key="rate_limit_override",
                 label="Rate Limit (seconds)",
                 field_type=FieldType.NUMBER,
-                default=0.5,
-                min_value=0.1,
+                default=0,
+                min_value=0,
                 max_value=5.0,
                 step=0.1,
                 description="Delay between requests (0 = use global setting)"
@@ -223,7 +245,11 @@ class ExamplePlugin(PluginInterface):
         """Build a plan for downloading selected chapters."""
         
         # Filter chapters based on selection
-        selected_chapters = selection.chapters_in_range(manga_info.chapters)
+        selected_chapters = manga_info.chapters_for(selection)
+        
+        # Chapter folders relative to the output dir, which is only known later
+        manga_dir = Path(self._sanitize_filename(manga_info.title))
+        chapter_dirs = [manga_dir / f"Chapter_{ch.number:05.1f}" for ch in selected_chapters]
         
         return DownloadPlan(
             manga_title=manga_info.title,
@@ -232,6 +258,7 @@ class ExamplePlugin(PluginInterface):
             extra={
                 "manga_url": url,
                 "cover_url": manga_info.cover_url,
+                "chapter_dirs": chapter_dirs,
             }
         )
     
@@ -250,71 +277,108 @@ class ExamplePlugin(PluginInterface):
         3. Download each image
         4. Save to disk
         
+        Requests should go through the shared client in
+        plan.extra["http_client"] so connections are reused across tasks.
+        
         This demo simulates the process.
         """
-        output_dir = Path(plan.output_dir) / self._sanitize_filename(plan.manga_title)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        # Create every chapter folder up front in one worker-thread call
+        output_root = Path(plan.output_dir)
+        chapter_dirs = [output_root / d for d in plan.extra["chapter_dirs"]]
+        await asyncio.to_thread(_bulk_mkdir, chapter_dirs)
         
-        rate_limit = plan.options.get("rate_limit_override", self.rate_limit)
+        # Rate limiting is shared by all pages, so they can overlap. An
+        # override gets its own limiter; the plugin-wide one is shared by
+        # concurrent downloads and must not be changed here.
+        rate_limit_override = float(plan.options.get("rate_limit_override") or 0)
+        if rate_limit_override > 0:
+            rate_limiter = RateLimiter(rate_limit_override)
+        else:
+            rate_limiter = self._rate_limiter
+        concurrent_pages = int(plan.options.get("concurrent_pages", 8))
+        
+        # Smoothed speed for this download: [ewma bytes/s, last format time, text].
+        # The text is only re-formatted every SPEED_REFRESH_INTERVAL seconds.
+        speed_state = [0.0, 0.0, ""]
+        loop_time = asyncio.get_running_loop().time
         
-        for chapter_idx, chapter in enumerate(plan.chapters):
+        for chapter, chapter_dir in zip(plan.chapters, chapter_dirs):
             # Check cancellation
             cancel_token.check()
             
-            chapter_dir = output_dir / f"Chapter_{chapter.number:05.1f}"
-            chapter_dir.mkdir(parents=True, exist_ok=True)
-            
             # Simulate fetching page list
             page_count = chapter.page_count or random.randint(15, 30)
             
-            # Simulate downloading each page
-            for page in range(1, page_count + 1):
-                cancel_token.check()
-                
-                # Simulate download time and speed
-                download_time = random.uniform(0.05, 0.2)
-                await asyncio.sleep(download_time)
+            # Pages finish out of order, so progress reports the completed
+            # count. Callbacks run on the loop thread and never interleave.
+            completed = [0]
+            semaphore = asyncio.Semaphore(concurrent_pages)
+            # Speed text is only shown by progress listeners
+            report_speed = EventBus.instance().has_subscribers(EventType.DOWNLOAD_PROGRESS)
+            
+            async def download_page(page: int) -> None:
+                # Wait for the rate limiter before taking a slot, so the
+                # semaphore only counts pages that are actually downloading
+                async with rate_limiter:
+                    cancel_token.check()
+                async with semaphore:
+                    # Simulate download time and speed
+                    download_time = random.uniform(0.05, 0.2)
+                    await asyncio.sleep(download_time)
+                    
+                    # Simulate file size and speed
+                    file_size = random.randint(100_000, 500_000)  # 100KB - 500KB
+                    
+                    # Create a dummy file (in real plugin, save actual image).
+                    # Disk writes go to a worker thread to keep the loop free.
+                    page_file = chapter_dir / f"{page:03d}.jpg"
+                    await asyncio.to_thread(
+                        page_file.write_text,
+                        f"[Simulated image: Chapter {chapter.number}, Page {page}]"
+                    )
                 
-                # Simulate file size and speed
-                file_size = random.randint(100_000, 500_000)  # 100KB - 500KB
-                speed = file_size / download_time
-                speed_str = self._format_speed(speed)
+                # Update the speed average; a real plugin would time the request
+                sample = file_size / download_time
+                speed_state[0] = 0.8 * speed_state[0] + 0.2 * sample if speed_state[0] else sample
+                if report_speed:
+                    now = loop_time()
+                    if now - speed_state[1] > SPEED_REFRESH_INTERVAL:
+                        speed_state[1] = now
+                        speed_state[2] = self._format_speed(speed_state[0])
                 
                 # Report progress
+                completed[0] += 1
                 progress_callback(
                     chapter.number,
-                    page,
+                    completed[0],
                     page_count,
                     file_size,
-                    speed_str
+                    speed_state[2]
                 )
-                
-                # Rate limiting
-                if rate_limit > 0:
-                    await asyncio.sleep(rate_limit)
-                
-                # Create a dummy file (in real plugin, save actual image)
-                page_file = chapter_dir / f"{page:03d}.jpg"
-                page_file.write_text(f"[Simulated image: Chapter {chapter.number}, Page {page}]")
+            
+            page_tasks = [
+                asyncio.create_task(download_page(page))
+                for page in range(1, page_count + 1)
+            ]
+            try:
+                await asyncio.gather(*page_tasks)
+            except BaseException:
+                # Don't leave sibling pages running after a failure or cancel
+                for page_task in page_tasks:
+                    page_task.cancel()
+                raise
     
     def _sanitize_filename(self, name: str) -> str:
         """Remove invalid characters from filename."""
-        # Remove invalid characters
-        name = re.sub(r'[<>:"/\\|?*]', '', name)
-        # Limit length
-        return name[:100].strip()
+        # Remove invalid characters and limit length
+        return _INVALID_FN_CHARS.sub("", name)[:100].strip()
     
     def _format_speed(self, bytes_per_sec: float) -> str:
         """Format download speed for display."""
-        if bytes_per_sec >= 1_000_000:
-            return f"{bytes_per_sec / 1_000_000:.1f} MB/s"
-        elif bytes_per_sec >= 1_000:
-            return f"{bytes_per_sec / 1_000:.1f} KB/s"
-        else:
-            return f"{bytes_per_sec:.0f} B/s"
+        divisor, fmt = _SPEED_FORMATS[(bytes_per_sec >= 1_000) + (bytes_per_sec >= 1_000_000)]
+        return fmt % (bytes_per_sec / divisor)
     
     def cleanup(self) -> None:
         """Clean up resources."""
-        if self._client:
-            # Note: In async context, would use await client.aclose()
-            pass
+        # The shared HTTP client is owned and closed by the TaskManager
+        pass
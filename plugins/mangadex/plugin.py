@@ -12,22 +12,95 @@ Features:
 - CBZ archive creation option
 """
 import asyncio
+import json
+import os
+import random
 import re
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.parse import urlparse
+from functools import lru_cache, partial
 from typing import Optional
 from datetime import datetime
 
 import httpx
 
-from core.plugin_interface import PluginInterface, PLUGIN_API_VERSION
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Optional speedup; stdlib json parses the same bytes
+    _json_loads = json.loads
+
+from core.plugin_interface import PluginInterface, RateLimiter, PLUGIN_API_VERSION
 from core.models import (
     MangaInfo, Chapter, TranslationTeam,
     UserSelection, DownloadPlan, OptionsSchema,
-    OptionField, FieldType, CancelToken
+    OptionField, FieldType, CancelToken, CancelledException
+)
+
+
+# Read size when streaming page images to disk
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Downloaded bytes between recomputations of the displayed speed
+SPEED_REPORT_BYTES = 256 * 1024
+
+# Already-compressed image formats, stored in archives without deflating
+_COMPRESSED_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".webp", ".gif"})
+
+# Output format -> archive extension; formats not listed are saved as folders
+_ARCHIVE_EXTENSIONS = {"CBZ": ".cbz", "CBR": ".cbr", "ZIP": ".zip"}
+
+# (divisor, format) indexed by the number of thresholds (1 KB, 1 MB) reached
+_SPEED_FORMATS = (
+    (1, "%.0f B/s"),
+    (1_000, "%.1f KB/s"),
+    (1_000_000, "%.1f MB/s"),
 )
 
+# Retriable HTTP statuses; any other error status fails on the first try
+_RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Upper bound in seconds on a single retry back-off
+MAX_RETRY_DELAY = 30.0
+
+# Seconds between checks of a download's cancel token
+CANCEL_POLL_INTERVAL = 0.1
+
+# Shared "No Group" teams by language, for chapters without a scanlation group
+_NO_GROUP_TEAMS: dict[str, TranslationTeam] = {}
+
+# Filename sanitizing patterns
+_INVALID_FN_CHARS = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RUN = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=256)
+def _sanitize(name: str) -> str:
+    """Make a name safe for use as a file or folder name (memoized)."""
+    # Remove invalid characters
+    name = _INVALID_FN_CHARS.sub('', name)
+    # Replace multiple spaces
+    name = _WHITESPACE_RUN.sub(' ', name)
+    # Limit length
+    return name[:100].strip()
+
+
+def _page_ext(filename: str) -> str:
+    """Extension of a page file name, defaulting to .jpg (Path.suffix without the Path)."""
+    dot = filename.rfind(".")
+    return filename[dot:] if dot > 0 and dot < len(filename) - 1 else ".jpg"
+
+
+def _first_error(group: BaseExceptionGroup) -> BaseException:
+    """Pick the exception to re-raise from a failed TaskGroup, preferring cancellation."""
+    error = (group.subgroup(CancelledException) or group).exceptions[0]
+    while isinstance(error, BaseExceptionGroup):
+        error = error.exceptions[0]
+    return error
+
 
 class MangaDexPlugin(PluginInterface):
     """
@@ -45,8 +118,11 @@ class MangaDexPlugin(PluginInterface):
     
     # API configuration
     API_BASE = "https://api.mangadex.org"
+    # At-home URLs are valid for 15 minutes; keep a minute of margin
+    AT_HOME_CACHE_TTL = 840
     
-    # Plugin settings - MangaDex recommends 5 requests/second max
+    # Plugin settings - MangaDex recommends 5 requests/second max.
+    # This only applies to api.mangadex.org; at-home image hosts aren't limited.
     rate_limit = 0.25  # 250ms between requests
     max_retries = 3
     timeout = 30
@@ -57,61 +133,69 @@ class MangaDexPlugin(PluginInterface):
         re.IGNORECASE
     )
     
+    # Title URL, capturing the manga UUID
+    _URL_RE = re.compile(
+        r"^https?://(?:www\.)?mangadex\.org/title/"
+        r"([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})(?:[/?#]|$)",
+        re.IGNORECASE
+    )
+    
     def __init__(self):
         super().__init__()
         self._client: Optional[httpx.AsyncClient] = None
+        # Shared by every API call across tasks so the budget is global
+        self._api_limiter = RateLimiter(self.rate_limit)
         self._groups_cache: dict[str, TranslationTeam] = {}
+        # chapter_id -> (expires_at, server_info), oldest first
+        self._server_cache: dict[str, tuple[float, dict]] = {}
+        # Only held while a chapter's server lookup is in flight
+        self._server_locks: dict[str, asyncio.Lock] = {}
+        # Single writer thread for all archive I/O. ZipFile allows one writer
+        # at a time, so running every open/write/close on one thread keeps
+        # them in order without a lock or blocking the event loop.
+        self._archive_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mangadex-archive")
+        # Downloads still using the executor; cleanup() defers its shutdown
+        # until they finish. Guarded by the lock: cleanup() runs on the GUI
+        # thread, downloads on the task loop.
+        self._archive_users = 0
+        self._archive_closing = False
+        self._archive_lock = threading.Lock()
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
+        """
+        Get or create the HTTP client.
+        
+        The client lives for the whole session: HTTP/2 multiplexes concurrent
+        page requests to an at-home host over one warm connection.
+        """
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.timeout),
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60.0,
+                ),
+                timeout=httpx.Timeout(self.timeout, connect=10.0),
                 follow_redirects=True,
                 headers={
                     "User-Agent": "MangaDL/1.0 (MangaDex Plugin)",
                     "Accept": "application/json",
+                    "Connection": "keep-alive",
                 }
             )
         return self._client
     
     def can_handle(self, url: str) -> bool:
         """Check if this plugin can handle the URL."""
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
-            # Remove www. prefix for matching
-            if domain.startswith("www."):
-                domain = domain[4:]
-            
-            # Check domain
-            if domain != "mangadex.org":
-                return False
-            
-            # Must be a title URL with UUID
-            if "/title/" not in parsed.path:
-                return False
-            
-            # Extract and validate UUID
-            uuid = self._extract_manga_id(url)
-            return uuid is not None
-            
-        except Exception:
-            return False
+        # Must be a mangadex.org title URL with a UUID
+        return self._URL_RE.match(url) is not None
     
     def _extract_manga_id(self, url: str) -> Optional[str]:
         """Extract manga UUID from URL."""
-        parsed = urlparse(url)
-        path_parts = parsed.path.strip("/").split("/")
-        
         # URL format: /title/{uuid} or /title/{uuid}/slug-name
-        if len(path_parts) >= 2 and path_parts[0] == "title":
-            potential_uuid = path_parts[1]
-            if self.UUID_PATTERN.match(potential_uuid):
-                return potential_uuid.lower()
-        
-        return None
+        match = self._URL_RE.match(url)
+        return match.group(1).lower() if match else None
     
     def normalize_url(self, url: str) -> str:
         """Normalize the URL to a canonical form."""
@@ -162,9 +246,10 @@ class MangaDexPlugin(PluginInterface):
         url = f"{self.API_BASE}/manga/{manga_id}"
         params = {"includes[]": ["cover_art", "author", "artist"]}
         
-        response = await client.get(url, params=params)
+        async with self._api_limiter:
+            response = await client.get(url, params=params)
         response.raise_for_status()
-        data = response.json()
+        data = self._json(response)
         
         if data.get("result") != "ok":
             raise ValueError(f"API error: {data.get('errors', 'Unknown error')}")
@@ -216,14 +301,19 @@ class MangaDexPlugin(PluginInterface):
         client: httpx.AsyncClient, 
         manga_id: str
     ) -> tuple[list[Chapter], dict[str, TranslationTeam]]:
-        """Fetch all chapters for a manga with pagination."""
+        """
+        Fetch all chapters for a manga with pagination.
+        
+        The first page gives the total; the remaining pages are then requested
+        together (paced by the API rate limiter) and parsed in order as they
+        arrive, so parsing overlaps with the requests still in flight.
+        """
         chapters = []
         groups: dict[str, TranslationTeam] = {}
-        offset = 0
         limit = 100
+        url = f"{self.API_BASE}/manga/{manga_id}/feed"
         
-        while True:
-            url = f"{self.API_BASE}/manga/{manga_id}/feed"
+        async def fetch_page(offset: int) -> dict:
             params = {
                 "limit": limit,
                 "offset": offset,
@@ -231,33 +321,39 @@ class MangaDexPlugin(PluginInterface):
                 "includes[]": ["scanlation_group"],
                 "contentRating[]": ["safe", "suggestive", "erotica", "pornographic"],
             }
-            
-            response = await client.get(url, params=params)
+            async with self._api_limiter:
+                response = await client.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
-            
+            return self._json(response)
+        
+        def add_page(data: dict) -> None:
             if data.get("result") != "ok":
-                break
-            
-            chapter_list = data.get("data", [])
-            if not chapter_list:
-                break
-            
-            for ch_data in chapter_list:
+                return
+            for ch_data in data.get("data", []):
                 chapter, group = self._parse_chapter(ch_data)
                 if chapter:
                     chapters.append(chapter)
                 if group:
                     groups[group.id] = group
-            
-            # Check if we have more pages
-            total = data.get("total", 0)
-            offset += limit
-            if offset >= total:
-                break
-            
-            # Rate limiting
-            await asyncio.sleep(self.rate_limit)
+        
+        first_page = await fetch_page(0)
+        add_page(first_page)
+        if first_page.get("result") != "ok" or not first_page.get("data"):
+            return chapters, groups
+        
+        # Check if we have more pages
+        total = first_page.get("total", 0)
+        page_tasks = [
+            asyncio.create_task(fetch_page(offset))
+            for offset in range(limit, total, limit)
+        ]
+        try:
+            for page_task in page_tasks:
+                add_page(await page_task)
+        except BaseException:
+            for page_task in page_tasks:
+                page_task.cancel()
+            raise
         
         return chapters, groups
     
@@ -269,53 +365,44 @@ class MangaDexPlugin(PluginInterface):
         if attributes.get("externalUrl"):
             return None, None
         
-        # Get chapter number
+        # Get chapter number; oneshots and unnumbered chapters are 0
         chapter_num_str = attributes.get("chapter")
-        if chapter_num_str is None:
-            # Oneshot or unnumbered chapter
-            chapter_num = 0.0
-        else:
+        chapter_num = 0.0
+        if chapter_num_str:
             try:
                 chapter_num = float(chapter_num_str)
             except ValueError:
-                chapter_num = 0.0
+                pass
+        language = attributes.get("translatedLanguage", "en")
         
-        # Get scanlation group
+        # Get scanlation group; it's normally the first relationship
         group = None
-        group_id = None
-        for rel in ch_data.get("relationships", []):
+        for rel in ch_data.get("relationships", ()):
             if rel["type"] == "scanlation_group":
-                group_id = rel["id"]
-                if "attributes" in rel:
-                    group = TranslationTeam(
-                        id=rel["id"],
-                        name=rel["attributes"].get("name", "Unknown Group"),
-                        language=attributes.get("translatedLanguage", "en")
-                    )
-                else:
-                    group = TranslationTeam(
-                        id=rel["id"],
-                        name="Unknown Group",
-                        language=attributes.get("translatedLanguage", "en")
-                    )
+                rel_attributes = rel.get("attributes")
+                group = TranslationTeam(
+                    id=rel["id"],
+                    name=rel_attributes.get("name", "Unknown Group") if rel_attributes else "Unknown Group",
+                    language=language
+                )
                 break
-        
-        # If no group, create a "No Group" placeholder
-        if not group:
-            group_id = "no_group"
-            group = TranslationTeam(
-                id="no_group",
-                name="No Group",
-                language=attributes.get("translatedLanguage", "en")
-            )
+        else:
+            # If no group, use the shared "No Group" placeholder for the language
+            group = _NO_GROUP_TEAMS.get(language)
+            if group is None:
+                group = _NO_GROUP_TEAMS[language] = TranslationTeam(
+                    id="no_group",
+                    name="No Group",
+                    language=language
+                )
         
         chapter = Chapter(
             id=ch_data["id"],
             number=chapter_num,
             title=attributes.get("title") or f"Chapter {chapter_num}",
             url=f"https://mangadex.org/chapter/{ch_data['id']}",
-            translation_team_id=group_id,
-            language=attributes.get("translatedLanguage", "en"),
+            translation_team_id=group.id,
+            language=language,
             page_count=attributes.get("pages", 0),
         )
         
@@ -356,6 +443,16 @@ class MangaDexPlugin(PluginInterface):
                 step=1,
                 description="Number of pages to download simultaneously"
             ),
+            OptionField(
+                key="concurrent_chapters",
+                label="Concurrent Chapter Downloads",
+                field_type=FieldType.NUMBER,
+                default=2,
+                min_value=1,
+                max_value=4,
+                step=1,
+                description="Number of chapters to download simultaneously"
+            ),
         ])
     
     async def build_download_plan(
@@ -368,7 +465,7 @@ class MangaDexPlugin(PluginInterface):
         """Build a plan for downloading selected chapters."""
         
         # Filter chapters based on selection (chapter range + translation team)
-        selected_chapters = selection.chapters_in_range(manga_info.chapters)
+        selected_chapters = manga_info.chapters_for(selection)
         
         return DownloadPlan(
             manga_title=manga_info.title,
@@ -390,7 +487,7 @@ class MangaDexPlugin(PluginInterface):
         """
         Execute the download plan.
         
-        For each chapter:
+        For each chapter (up to concurrent_chapters at once):
         1. Get the at-home server URL
         2. Download all pages
         3. Optionally create CBZ archive
@@ -403,143 +500,249 @@ class MangaDexPlugin(PluginInterface):
         data_saver = plan.options.get("data_saver", False)
         output_format = plan.options.get("format", "CBZ")
         concurrent_pages = plan.options.get("concurrent_pages", 3)
-        
-        for chapter_idx, chapter in enumerate(plan.chapters):
-            cancel_token.check()
-            
-            # Create chapter directory
-            chapter_num_str = f"{chapter.number:g}" if chapter.number != int(chapter.number) else str(int(chapter.number))
-            chapter_dir = output_dir / f"Chapter {chapter_num_str.zfill(4)}"
-            chapter_dir.mkdir(parents=True, exist_ok=True)
-            
-            try:
-                # Get at-home server info
-                server_info = await self._get_at_home_server(client, chapter.id)
-                
-                if not server_info:
-                    raise ValueError(f"Could not get server info for chapter {chapter.number}")
-                
-                base_url = server_info["base_url"]
-                chapter_hash = server_info["hash"]
+        concurrent_chapters = int(plan.options.get("concurrent_chapters", 2))
+        
+        # Chapters run in parallel so one chapter's API round-trip and
+        # archiving overlap with another's page downloads. API calls still
+        # share self._api_limiter. Progress callbacks need no lock: they are
+        # synchronous and all run on this loop's thread.
+        chapter_semaphore = asyncio.Semaphore(concurrent_chapters)
+        loop = asyncio.get_running_loop()
+        archive_executor = self._archive_executor
+        
+        async def run_chapter(chapter: Chapter) -> None:
+            async with chapter_semaphore:
+                cancel_token.check()
                 
-                # Choose data or data-saver
-                if data_saver and server_info.get("data_saver"):
-                    page_files = server_info["data_saver"]
-                    quality_path = "data-saver"
-                else:
-                    page_files = server_info["data"]
-                    quality_path = "data"
+                chapter_num_str = f"{chapter.number:g}" if chapter.number != int(chapter.number) else str(int(chapter.number))
+                chapter_name = f"Chapter {chapter_num_str.zfill(4)}"
                 
-                total_pages = len(page_files)
+                # Archive formats add each page to the archive once it has
+                # downloaded (a ZipFile takes one open entry at a time, so
+                # concurrent pages are buffered, not streamed); only Folder
+                # output needs a chapter directory on disk
+                archive_ext = _ARCHIVE_EXTENSIONS.get(output_format)
+                archive: Optional[zipfile.ZipFile] = None
+                # The archive is built under a temporary name and only renamed
+                # once every page is in, so a failed chapter leaves no archive
+                archive_path = output_dir / f"{chapter_name}{archive_ext}" if archive_ext else None
+                partial_path = archive_path.with_name(archive_path.name + ".part") if archive_path else None
+                completed = False
+                if archive_ext is None:
+                    chapter_dir = output_dir / chapter_name
+                    chapter_dir.mkdir(parents=True, exist_ok=True)
                 
-                # Download pages with concurrency limit
-                semaphore = asyncio.Semaphore(concurrent_pages)
-                downloaded_files = []
-                total_bytes = 0
-                start_time = asyncio.get_event_loop().time()
-                
-                async def download_page(page_idx: int, filename: str):
-                    nonlocal total_bytes
-                    async with semaphore:
-                        cancel_token.check()
-                        
-                        page_url = f"{base_url}/{quality_path}/{chapter_hash}/{filename}"
-                        
+                try:
+                    # Get at-home server info
+                    server_info = await self._get_at_home_server(client, chapter.id)
+                    
+                    if not server_info:
+                        raise ValueError(f"Could not get server info for chapter {chapter.number}")
+                    
+                    base_url = server_info["base_url"]
+                    chapter_hash = server_info["hash"]
+                    
+                    # Choose data or data-saver
+                    if data_saver and server_info.get("data_saver"):
+                        page_files = server_info["data_saver"]
+                        quality_path = "data-saver"
+                    else:
+                        page_files = server_info["data"]
+                        quality_path = "data"
+                    
+                    total_pages = len(page_files)
+                    
+                    # Page URLs and file names, worked out once before fan-out
+                    page_base = f"{base_url}/{quality_path}/{chapter_hash}"
+                    pages = [
+                        (f"{page_base}/{filename}", f"{idx + 1:03d}{_page_ext(filename)}")
+                        for idx, filename in enumerate(page_files)
+                    ]
+                    
+                    if archive_ext is not None:
+                        # CBR is RAR format, but we create as ZIP since Python lacks RAR write support
+                        # Most comic readers can still open it
+                        # A chapter is far below zipfile's 2 GiB non-ZIP64 limit,
+                        # so no ZIP64 records are needed
+                        archive = await loop.run_in_executor(
+                            archive_executor,
+                            partial(
+                                zipfile.ZipFile, partial_path, "w",
+                                zipfile.ZIP_STORED, allowZip64=False
+                            )
+                        )
+                    
+                    # Download pages with concurrency limit
+                    semaphore = asyncio.Semaphore(concurrent_pages)
+                    total_bytes = 0
+                    pages_done = 0  # Pages finish out of order, so report a count
+                    start_time = time.monotonic()
+                    # Speed text is only recomputed every SPEED_REPORT_BYTES
+                    speed_str = ""
+                    last_speed_bytes = 0
+                    
+                    async def download_page(page_url: str, page_name: str):
+                        nonlocal total_bytes, pages_done, speed_str, last_speed_bytes
+                        # The semaphore only bounds requests in flight: retry
+                        # back-off and archive writes happen outside it, so a
+                        # waiting page never holds a download slot
                         for retry in range(self.max_retries):
                             try:
-                                response = await client.get(page_url)
-                                response.raise_for_status()
-                                
-                                # Determine file extension
-                                ext = Path(filename).suffix or ".jpg"
-                                page_file = chapter_dir / f"{(page_idx + 1):03d}{ext}"
-                                page_file.write_bytes(response.content)
-                                
-                                file_size = len(response.content)
-                                total_bytes += file_size
-                                
-                                # Calculate speed
-                                elapsed = asyncio.get_event_loop().time() - start_time
-                                speed = total_bytes / elapsed if elapsed > 0 else 0
-                                speed_str = self._format_speed(speed)
-                                
-                                # Report progress
-                                progress_callback(
-                                    chapter.number,
-                                    page_idx + 1,
-                                    total_pages,
-                                    file_size,
-                                    speed_str
-                                )
-                                
-                                downloaded_files.append(page_file)
+                                file_size = 0
+                                chunks = []
+                                async with semaphore:
+                                    cancel_token.check()
+                                    async with client.stream("GET", page_url) as response:
+                                        response.raise_for_status()
+                                        if archive is not None:
+                                            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                                                chunks.append(chunk)
+                                                file_size += len(chunk)
+                                        else:
+                                            # Stream to disk in chunks rather than buffering the image
+                                            f = await asyncio.to_thread((chapter_dir / page_name).open, "wb")
+                                            try:
+                                                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                                                    await asyncio.to_thread(f.write, chunk)
+                                                    file_size += len(chunk)
+                                            finally:
+                                                await asyncio.to_thread(f.close)
                                 break
-                                
-                            except httpx.HTTPStatusError as e:
-                                if retry < self.max_retries - 1:
-                                    await asyncio.sleep(1 * (retry + 1))
-                                else:
+                            
+                            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                                delay = self._retry_delay(e, retry)
+                                if delay is None or retry == self.max_retries - 1:
                                     raise
+                                await asyncio.sleep(delay)
                         
-                        # Rate limiting between pages
-                        await asyncio.sleep(self.rate_limit)
-                
-                # Download all pages
-                tasks = [
-                    download_page(idx, filename) 
-                    for idx, filename in enumerate(page_files)
-                ]
-                await asyncio.gather(*tasks)
-                
-                # Create archive based on format
-                if output_format != "Folder" and downloaded_files:
-                    chapter_name = f"Chapter {chapter_num_str.zfill(4)}"
-                    
-                    if output_format == "CBZ":
-                        archive_path = output_dir / f"{chapter_name}.cbz"
-                        self._create_archive(chapter_dir, archive_path, downloaded_files, "zip")
-                    elif output_format == "CBR":
-                        # CBR is RAR format, but we create as ZIP since Python lacks RAR write support
-                        # Most comic readers can still open it
-                        archive_path = output_dir / f"{chapter_name}.cbr"
-                        self._create_archive(chapter_dir, archive_path, downloaded_files, "zip")
-                    elif output_format == "ZIP":
-                        archive_path = output_dir / f"{chapter_name}.zip"
-                        self._create_archive(chapter_dir, archive_path, downloaded_files, "zip")
+                        if archive is not None:
+                            await loop.run_in_executor(
+                                archive_executor,
+                                self._write_archive_entry, archive, page_name, b"".join(chunks)
+                            )
+                        
+                        # Speed is display-only, so it is worked out outside the slot too
+                        total_bytes += file_size
+                        if total_bytes - last_speed_bytes >= SPEED_REPORT_BYTES or not speed_str:
+                            last_speed_bytes = total_bytes
+                            elapsed = time.monotonic() - start_time
+                            speed_str = self._format_speed(total_bytes / elapsed if elapsed > 0 else 0)
+                        
+                        # Report progress
+                        pages_done += 1
+                        progress_callback(
+                            chapter.number,
+                            pages_done,
+                            total_pages,
+                            file_size,
+                            speed_str
+                        )
                     
-                    # Remove images after creating archive
-                    for img_file in downloaded_files:
-                        try:
-                            img_file.unlink()
-                        except Exception:
-                            pass
+                    # Download all pages. The first failure cancels the
+                    # remaining pages instead of letting them run to the end.
                     try:
-                        chapter_dir.rmdir()
-                    except Exception:
-                        pass
+                        async with asyncio.TaskGroup() as tg:
+                            for page_url, page_name in pages:
+                                tg.create_task(download_page(page_url, page_name))
+                    except BaseExceptionGroup as eg:
+                        raise _first_error(eg) from None
+                    completed = True
                 
-            except Exception as e:
-                # Log error but continue with next chapter
-                progress_callback(
-                    chapter.number,
-                    0,
-                    1,
-                    0,
-                    f"Error: {e}"
-                )
-            
-            # Rate limit between chapters
-            await asyncio.sleep(self.rate_limit * 2)
+                except CancelledException:
+                    raise
+                except Exception as e:
+                    # Log error but continue with the other chapters
+                    progress_callback(
+                        chapter.number,
+                        0,
+                        1,
+                        0,
+                        f"Error: {e}"
+                    )
+                
+                finally:
+                    if archive is not None:
+                        await loop.run_in_executor(
+                            archive_executor, self._finish_archive,
+                            archive, partial_path, archive_path, completed
+                        )
+        
+        async def watch_cancel() -> None:
+            # The token is set from the UI thread. Failing the task group
+            # once it is cancelled also stops page requests already in flight.
+            while not cancel_token.is_cancelled:
+                await asyncio.sleep(CANCEL_POLL_INTERVAL)
+            raise CancelledException("Download was cancelled")
+        
+        with self._archive_lock:
+            self._archive_users += 1
+        try:
+            async with asyncio.TaskGroup() as tg:
+                watcher = tg.create_task(watch_cancel())
+                chapter_tasks = [tg.create_task(run_chapter(chapter)) for chapter in plan.chapters]
+                if chapter_tasks:
+                    await asyncio.wait(chapter_tasks)
+                watcher.cancel()
+        except BaseExceptionGroup as eg:
+            raise _first_error(eg) from None
+        finally:
+            with self._archive_lock:
+                self._archive_users -= 1
+                shutdown = self._archive_closing and not self._archive_users
+            if shutdown:
+                self._archive_executor.shutdown(wait=False)
     
     async def _get_at_home_server(self, client: httpx.AsyncClient, chapter_id: str) -> Optional[dict]:
-        """Get the at-home server URL for a chapter."""
+        """
+        Get the at-home server URL for a chapter.
+        
+        Results are cached for AT_HOME_CACHE_TTL seconds, so retries and
+        re-runs of a chapter skip the API call. A per-chapter lock makes
+        concurrent callers share one request.
+        """
+        cache = self._server_cache
+        entry = cache.get(chapter_id)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        
+        lock = self._server_locks.get(chapter_id)
+        if lock is None:
+            lock = self._server_locks[chapter_id] = asyncio.Lock()
+        async with lock:
+            try:
+                entry = cache.get(chapter_id)
+                if entry and entry[0] > time.monotonic():
+                    return entry[1]
+                
+                server_info = await self._fetch_at_home_server(client, chapter_id)
+                if server_info:
+                    now = time.monotonic()
+                    # Entries share one TTL, so insertion order is expiry
+                    # order and expired entries are all at the front
+                    while cache:
+                        oldest = next(iter(cache))
+                        if cache[oldest][0] > now:
+                            break
+                        del cache[oldest]
+                    cache.pop(chapter_id, None)
+                    cache[chapter_id] = (now + self.AT_HOME_CACHE_TTL, server_info)
+                return server_info
+            finally:
+                # Callers already waiting still share this lock; later ones
+                # find the cached result or start a fresh lock
+                if self._server_locks.get(chapter_id) is lock:
+                    del self._server_locks[chapter_id]
+    
+    async def _fetch_at_home_server(self, client: httpx.AsyncClient, chapter_id: str) -> Optional[dict]:
+        """Request the at-home server URL for a chapter from the API."""
         url = f"{self.API_BASE}/at-home/server/{chapter_id}"
         
         for retry in range(self.max_retries):
             try:
-                response = await client.get(url)
+                async with self._api_limiter:
+                    response = await client.get(url)
                 response.raise_for_status()
-                data = response.json()
+                data = self._json(response)
                 
                 if data.get("result") != "ok":
                     return None
@@ -552,55 +755,87 @@ class MangaDexPlugin(PluginInterface):
                     "data_saver": chapter_data.get("dataSaver", []),
                 }
                 
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429:
-                    # Rate limited, wait and retry
-                    await asyncio.sleep(5 * (retry + 1))
-                elif retry < self.max_retries - 1:
-                    await asyncio.sleep(1 * (retry + 1))
-                else:
+            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                delay = self._retry_delay(e, retry)
+                if delay is None or retry == self.max_retries - 1:
                     raise
+                await asyncio.sleep(delay)
         
         return None
     
-    def _create_archive(self, source_dir: Path, archive_path: Path, files: list[Path], format_type: str = "zip") -> None:
-        """Create an archive from downloaded images.
-        
-        Args:
-            source_dir: Directory containing the images
-            archive_path: Path for the output archive
-            files: List of image files to include
-            format_type: Archive format ("zip" for CBZ/CBR/ZIP)
+    @staticmethod
+    def _retry_delay(error: Exception, retry: int) -> Optional[float]:
         """
-        if format_type == "zip":
-            with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                for img_file in sorted(files):
-                    if img_file.exists():
-                        zf.write(img_file, img_file.name)
+        Seconds to wait before retrying a failed request, or None if the
+        error is not worth retrying.
+        
+        Backs off exponentially with random jitter so concurrent pages don't
+        retry in lockstep. Rate limit responses (429/503) wait as long as the
+        server asks, via Retry-After or MangaDex's X-RateLimit-Retry-After.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            response = error.response
+            status = response.status_code
+            if status not in _RETRY_STATUSES:
+                return None
+            if status in (429, 503):
+                headers = response.headers
+                try:
+                    if "Retry-After" in headers:
+                        wait = float(headers["Retry-After"])
+                    elif "X-RateLimit-Retry-After" in headers:
+                        # Unix timestamp at which the limit resets
+                        wait = float(headers["X-RateLimit-Retry-After"]) - time.time()
+                    else:
+                        wait = None
+                except ValueError:
+                    wait = None
+                if wait is not None:
+                    return min(max(wait, 0.0), MAX_RETRY_DELAY) + random.random()
+        return min(2 ** retry + random.random(), MAX_RETRY_DELAY)
+    
+    @staticmethod
+    def _json(response: httpx.Response):
+        """Decode a JSON response body."""
+        return _json_loads(response.content)
+    
+    @staticmethod
+    def _finish_archive(
+        archive: zipfile.ZipFile, partial_path: Path, archive_path: Path, completed: bool
+    ) -> None:
+        """Close a chapter archive; keep it under its final name only if every page made it."""
+        archive.close()
+        if completed:
+            os.replace(partial_path, archive_path)
+        else:
+            partial_path.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _write_archive_entry(archive: zipfile.ZipFile, name: str, data: bytes) -> None:
+        """Add one page to an open archive."""
+        # Deflate gains next to nothing on JPEG/PNG/WebP data
+        compress_type = (
+            zipfile.ZIP_STORED
+            if _page_ext(name).lower() in _COMPRESSED_SUFFIXES
+            else zipfile.ZIP_DEFLATED
+        )
+        archive.writestr(name, data, compress_type=compress_type)
     
     def _sanitize_filename(self, name: str) -> str:
         """Remove invalid characters from filename."""
-        # Remove invalid characters
-        name = re.sub(r'[<>:"/\\|?*]', '', name)
-        # Replace multiple spaces
-        name = re.sub(r'\s+', ' ', name)
-        # Limit length
-        return name[:100].strip()
+        return _sanitize(name)
     
     def _format_speed(self, bytes_per_sec: float) -> str:
         """Format download speed for display."""
-        if bytes_per_sec >= 1_000_000:
-            return f"{bytes_per_sec / 1_000_000:.1f} MB/s"
-        elif bytes_per_sec >= 1_000:
-            return f"{bytes_per_sec / 1_000:.1f} KB/s"
-        else:
-            return f"{bytes_per_sec:.0f} B/s"
+        divisor, fmt = _SPEED_FORMATS[(bytes_per_sec >= 1_000) + (bytes_per_sec >= 1_000_000)]
+        return fmt % (bytes_per_sec / divisor)
     
     async def test_connection(self) -> tuple[bool, str]:
         """Test if we can connect to MangaDex API."""
         try:
             client = await self._get_client()
-            response = await client.get(f"{self.API_BASE}/ping")
+            async with self._api_limiter:
+                response = await client.get(f"{self.API_BASE}/ping")
             
             if response.status_code == 200:
                 return (True, "Connected to MangaDex API successfully")
@@ -612,7 +847,16 @@ class MangaDexPlugin(PluginInterface):
     
     def cleanup(self) -> None:
         """Clean up resources."""
+        # The client is closed by aclose() on the download loop. The archive
+        # executor is left to downloads still running on this instance; the
+        # last one shuts it down. Queued archive work is not cancelled.
+        with self._archive_lock:
+            self._archive_closing = True
+            shutdown = not self._archive_users
+        if shutdown:
+            self._archive_executor.shutdown(wait=False)
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client and its pooled connections."""
         if self._client and not self._client.is_closed:
-            # Note: proper cleanup would use await client.aclose()
-            # but we're in a sync context here
-            pass
+            await self._client.aclose()
@@ -1,5 +1,5 @@
 # UI module - PySide6 components
 from .main_window import MainWindow
-from .styles import STYLES, Colors
+from .styles import STYLES, Colors, apply_styles
 
-__all__ = ["MainWindow", "STYLES", "Colors"]
+__all__ = ["MainWindow", "STYLES", "Colors", "apply_styles"]
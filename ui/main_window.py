@@ -9,7 +9,6 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QIcon, QFont
 
-from .styles import STYLES
 from .pages.queue_page import QueuePage
 from .pages.history_page import HistoryPage
 from .pages.plugins_page import PluginsPage
@@ -20,28 +19,34 @@ from core import PluginManager, TaskManager, EventBus
 class MainWindow(QMainWindow):
     """Main application window."""
     
+    # Emitted from any thread when the event bus goes from idle to pending
+    _events_pending = Signal()
+    
     def __init__(self, plugin_manager: PluginManager, task_manager: TaskManager, settings: dict):
         super().__init__()
         
         self.plugin_manager = plugin_manager
         self.task_manager = task_manager
         self.settings = settings
-        self.event_bus = EventBus()
+        self.event_bus = EventBus.instance()
         
         self.setWindowTitle("MangaDL")
         self.setMinimumSize(1200, 800)
         self.resize(1400, 900)
         
-        # Apply styles
-        self.setStyleSheet(STYLES)
-        
         # Setup UI
         self._setup_ui()
         
-        # Start event processing timer
+        # Event processing is signaled by the bus rather than polled. The
+        # single-shot timer batches a burst into one drain, at most 20 per second.
         self._event_timer = QTimer(self)
+        self._event_timer.setSingleShot(True)
+        self._event_timer.setInterval(50)
         self._event_timer.timeout.connect(self._process_events)
-        self._event_timer.start(50)  # 20 fps
+        self._events_pending.connect(self._on_events_pending, Qt.QueuedConnection)
+        self.event_bus.set_wake_callback(self._events_pending.emit)
+        # Events queued before the callback was set
+        self._schedule_event_processing()
     
     def _setup_ui(self):
         """Setup the main UI layout."""
@@ -68,6 +73,9 @@ class MainWindow(QMainWindow):
         self.history_page = HistoryPage(self.task_manager)
         self.plugins_page = PluginsPage(self.plugin_manager)
         self.settings_page = SettingsPage(self.settings)
+        self.settings_page.settings_changed.connect(self._on_settings_changed)
+        # Settings were loaded after the task manager started
+        self._on_settings_changed()
         
         self.content_stack.addWidget(self.queue_page)
         self.content_stack.addWidget(self.history_page)
@@ -135,16 +143,39 @@ class MainWindow(QMainWindow):
         self.content_stack.setCurrentIndex(index)
         self.nav_buttons[index].setChecked(True)
     
+    def _schedule_event_processing(self):
+        """Arrange for queued events to be processed, if not already pending."""
+        if self.event_bus.has_pending() and not self._event_timer.isActive():
+            self._event_timer.start()
+    
+    def _on_events_pending(self):
+        """
+        Start a drain for a wake signal, even if the queue already looks empty.
+        
+        A drain that runs between a producer's flag check and its set() leaves
+        the flag set on an empty queue, which silences later wakes. Draining
+        anyway clears the stale flag.
+        """
+        if not self._event_timer.isActive():
+            self._event_timer.start()
+    
     def _process_events(self):
         """Process queued events from the event bus."""
         self.event_bus.process_queue(50)
+        # Rest of a large burst, or events that raced the drain
+        self._schedule_event_processing()
+    
+    def _on_settings_changed(self):
+        """Push settings that need a live update into the task manager."""
+        self.task_manager.set_max_parallel(self.settings.get("max_parallel_downloads", 16))
     
     def closeEvent(self, event):
         """Handle window close."""
         # Stop task manager
         self.task_manager.stop()
         
-        # Stop event timer
+        # Stop event processing
+        self.event_bus.set_wake_callback(None)
         self._event_timer.stop()
         
         event.accept()
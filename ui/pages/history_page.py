@@ -3,13 +3,100 @@ History page - view completed downloads.
 """
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QTableWidget, QTableWidgetItem, QHeaderView,
+    QTableView, QHeaderView,
     QPushButton, QFrame, QAbstractItemView
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from PySide6.QtGui import QBrush, QColor
+from typing import Optional
 
-from core import TaskManager, TaskStatus
-from ..styles import Colors
+from core import Task, TaskManager, TaskStatus
+from ..styles import Colors, ROW_HEIGHT
+
+
+# Status text brushes, built once and shared by every cell
+_STATUS_BRUSHES = {
+    TaskStatus.COMPLETED: QBrush(QColor(Colors.SUCCESS)),
+    TaskStatus.FAILED: QBrush(QColor(Colors.ERROR)),
+}
+
+
+class HistoryTableModel(QAbstractTableModel):
+    """
+    Table model over the finished tasks.
+    Cell text is produced on demand in data(), so only visible rows cost anything.
+    Rows are exposed FETCH_CHUNK at a time; the view asks for more via
+    fetchMore() as it scrolls toward the end.
+    """
+    
+    HEADERS = ("Title", "Chapters", "Status", "Date", "Errors")
+    FETCH_CHUNK = 200
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks: list[Task] = []
+        self._loaded = 0  # Rows exposed to the view so far
+        # Row -> "completed/total"; finished tasks don't change, so each row
+        # is formatted once per reset rather than on every repaint
+        self._chapters_text: dict[int, str] = {}
+    
+    def set_tasks(self, tasks: list[Task]) -> None:
+        """Replace the displayed tasks."""
+        self.beginResetModel()
+        self._tasks = tasks
+        self._chapters_text.clear()
+        self._loaded = min(len(tasks), self.FETCH_CHUNK)
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+    
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._tasks)
+    
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        end = min(len(self._tasks), self._loaded + self.FETCH_CHUNK)
+        if end <= self._loaded:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, end - 1)
+        self._loaded = end
+        self.endInsertRows()
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        task = self._tasks[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return task.display_title
+            if column == 1:
+                row = index.row()
+                text = self._chapters_text.get(row)
+                if text is None:
+                    text = self._chapters_text[row] = f"{task.completed_chapters}/{task.total_chapters}"
+                return text
+            if column == 2:
+                return task.status.name.capitalize()
+            if column == 3:
+                # Date (placeholder)
+                return "-"
+            if column == 4:
+                return "; ".join(task.errors) if task.errors else "-"
+        elif role == Qt.ForegroundRole and column == 2:
+            return _STATUS_BRUSHES.get(task.status)
+        return None
 
 
 class HistoryPage(QWidget):
@@ -18,6 +105,8 @@ class HistoryPage(QWidget):
     def __init__(self, task_manager: TaskManager):
         super().__init__()
         self.task_manager = task_manager
+        self._last_task_revision: Optional[int] = None
+        self._refresh_pending = False
         self._setup_ui()
     
     def _setup_ui(self):
@@ -46,7 +135,7 @@ class HistoryPage(QWidget):
             "📚 Download history shows completed, failed, and canceled downloads. "
             "Clear the history to remove old entries."
         )
-        info_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+        info_label.setObjectName("info_label")
         info_label.setWordWrap(True)
         info_layout.addWidget(info_label)
         
@@ -73,17 +162,20 @@ class HistoryPage(QWidget):
         content_layout.addLayout(header_layout)
         
         # History table
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(5)
-        self.history_table.setHorizontalHeaderLabels([
-            "Title", "Chapters", "Status", "Date", "Errors"
-        ])
+        self.history_model = HistoryTableModel(self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
         
         self.history_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.history_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.history_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.history_table.setShowGrid(False)
         self.history_table.verticalHeader().setVisible(False)
+        # Fixed single-line rows: Qt never measures row heights
+        self.history_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.history_table.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+        self.history_table.setWordWrap(False)
+        self.history_table.setTextElideMode(Qt.ElideRight)
         
         header = self.history_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
@@ -101,36 +193,14 @@ class HistoryPage(QWidget):
     
     def _refresh_history(self):
         """Refresh the history table."""
+        # Nothing to redraw if no task changed since last time
+        revision = self.task_manager.revision
+        if revision == self._last_task_revision:
+            return
+        self._last_task_revision = revision
+        
         # Get completed/failed/canceled tasks
-        tasks = [
-            t for t in self.task_manager.get_all_tasks()
-            if t.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELED)
-        ]
-        
-        self.history_table.setRowCount(len(tasks))
-        
-        for row, task in enumerate(tasks):
-            # Title
-            self.history_table.setItem(row, 0, QTableWidgetItem(task.display_title))
-            
-            # Chapters
-            chapters_text = f"{task.completed_chapters}/{task.total_chapters}"
-            self.history_table.setItem(row, 1, QTableWidgetItem(chapters_text))
-            
-            # Status
-            status_item = QTableWidgetItem(task.status.name.capitalize())
-            if task.status == TaskStatus.COMPLETED:
-                status_item.setForeground(Qt.GlobalColor.green)
-            elif task.status == TaskStatus.FAILED:
-                status_item.setForeground(Qt.GlobalColor.red)
-            self.history_table.setItem(row, 2, status_item)
-            
-            # Date (placeholder)
-            self.history_table.setItem(row, 3, QTableWidgetItem("-"))
-            
-            # Errors
-            errors_text = "; ".join(task.errors) if task.errors else "-"
-            self.history_table.setItem(row, 4, QTableWidgetItem(errors_text))
+        self.history_model.set_tasks(self.task_manager.get_history_tasks())
     
     def _on_clear_history(self):
         """Clear download history."""
@@ -140,4 +210,12 @@ class HistoryPage(QWidget):
     def showEvent(self, event):
         """Refresh when page is shown."""
         super().showEvent(event)
+        # Populate after the page has painted; repeated shows share one refresh
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._on_deferred_refresh)
+    
+    def _on_deferred_refresh(self):
+        """Run the refresh queued by showEvent."""
+        self._refresh_pending = False
         self._refresh_history()
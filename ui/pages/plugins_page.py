@@ -3,17 +3,143 @@ Plugins page - manage and test plugins.
 """
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QTableWidget, QTableWidgetItem, QHeaderView,
+    QTableView, QHeaderView,
     QPushButton, QFrame, QLineEdit, QTextEdit,
-    QCheckBox, QAbstractItemView, QGroupBox
+    QAbstractItemView, QGroupBox
 )
-from PySide6.QtCore import Qt
-import subprocess
-import sys
+from PySide6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QTimer,
+    QObject, QRunnable, QThreadPool, Signal, QUrl
+)
+from PySide6.QtGui import QDesktopServices
 from pathlib import Path
+from typing import Optional
 
 from core import PluginManager
-from ..styles import Colors
+from ..styles import ROW_HEIGHT
+
+
+class _JobSignals(QObject):
+    """Signals for a pool job; delivered to the GUI thread as queued calls."""
+    finished = Signal(object)
+
+
+class _TestUrlJob(QRunnable):
+    """Match a URL against the loaded plugins on a pool thread."""
+    
+    def __init__(self, plugin_manager: PluginManager, url: str):
+        super().__init__()
+        self.plugin_manager = plugin_manager
+        self.url = url
+        self.signals = _JobSignals()
+        # Owned by the page until its result arrives
+        self.setAutoDelete(False)
+    
+    def run(self):
+        """Emit finished with (plugin or None, normalized URL or error)."""
+        try:
+            plugin = self.plugin_manager.get_plugin_for_url(self.url)
+            detail = plugin.normalize_url(self.url) if plugin else None
+        except Exception as e:
+            plugin, detail = None, e
+        self.signals.finished.emit((plugin, detail))
+
+
+class _ReloadJob(QRunnable):
+    """
+    Import plugins for a reload on a pool thread. The new plugins are
+    swapped in by the page on the GUI thread (PluginManager.finish_reload).
+    """
+    
+    def __init__(self, plugin_manager: PluginManager):
+        super().__init__()
+        self.plugin_manager = plugin_manager
+        self.signals = _JobSignals()
+        self.setAutoDelete(False)
+    
+    def run(self):
+        """Emit finished with the prepared plugin tables, or the error."""
+        try:
+            result = self.plugin_manager.prepare_reload()
+        except Exception as e:
+            result = e
+        self.signals.finished.emit(result)
+
+
+class PluginsTableModel(QAbstractTableModel):
+    """
+    Table model over PluginManager.get_plugin_info().
+    The Enabled column is a native check state, toggled through setData().
+    """
+    
+    HEADERS = ("Enabled", "Name", "Version", "Domains", "Author", "API Version")
+    
+    def __init__(self, plugin_manager: PluginManager, parent=None):
+        super().__init__(parent)
+        self.plugin_manager = plugin_manager
+        self._plugins: list[dict] = []
+    
+    def set_plugins(self, plugins_info: list[dict]) -> None:
+        """Replace the displayed plugin info."""
+        self.beginResetModel()
+        self._plugins = plugins_info
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._plugins)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        info = self._plugins[index.row()]
+        column = index.column()
+        
+        if role == Qt.CheckStateRole and column == 0:
+            return Qt.Checked if info["enabled"] else Qt.Unchecked
+        if role == Qt.DisplayRole:
+            if column == 1:
+                return info["name"]
+            if column == 2:
+                return info["version"]
+            if column == 3:
+                return info["domains_display"]
+            if column == 4:
+                return info["author"]
+            if column == 5:
+                return info["api_version_display"]
+        return None
+    
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        """Enable or disable a plugin from its Enabled check box."""
+        if not index.isValid() or index.column() != 0 or role != Qt.CheckStateRole:
+            return False
+        info = self._plugins[index.row()]
+        enabled = Qt.CheckState(value) == Qt.Checked
+        if enabled:
+            changed = self.plugin_manager.enable_plugin(info["id"])
+        else:
+            changed = self.plugin_manager.disable_plugin(info["id"])
+        if not changed:
+            return False
+        info["enabled"] = enabled
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
 
 
 class PluginsPage(QWidget):
@@ -22,6 +148,12 @@ class PluginsPage(QWidget):
     def __init__(self, plugin_manager: PluginManager):
         super().__init__()
         self.plugin_manager = plugin_manager
+        self._test_job: Optional[_TestUrlJob] = None
+        self._reload_job: Optional[_ReloadJob] = None
+        # (plugin name, exception) pairs currently shown in errors_text
+        self._last_errors_key: tuple = ()
+        self._last_plugin_revision: Optional[int] = None
+        self._refresh_pending = False
         self._setup_ui()
         self._refresh_plugins()
     
@@ -51,7 +183,7 @@ class PluginsPage(QWidget):
             "🔌 Plugins extend MangaDL to support different manga websites. "
             "Each plugin handles URL matching, metadata fetching, and downloading for specific sites."
         )
-        info_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+        info_label.setObjectName("info_label")
         info_label.setWordWrap(True)
         info_layout.addWidget(info_label)
         
@@ -79,23 +211,26 @@ class PluginsPage(QWidget):
         header_layout.addWidget(header_label)
         
         self.plugin_count_label = QLabel("0 plugins")
-        self.plugin_count_label.setStyleSheet(f"color: {Colors.TEXT_MUTED};")
+        self.plugin_count_label.setObjectName("count_label")
         header_layout.addWidget(self.plugin_count_label)
         
         header_layout.addStretch()
         content_layout.addLayout(header_layout)
         
-        self.plugins_table = QTableWidget()
-        self.plugins_table.setColumnCount(6)
-        self.plugins_table.setHorizontalHeaderLabels([
-            "Enabled", "Name", "Version", "Domains", "Author", "API Version"
-        ])
+        self.plugins_model = PluginsTableModel(self.plugin_manager, self)
+        self.plugins_table = QTableView()
+        self.plugins_table.setModel(self.plugins_model)
         
         self.plugins_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.plugins_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.plugins_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.plugins_table.setShowGrid(False)
         self.plugins_table.verticalHeader().setVisible(False)
+        # Fixed single-line rows: Qt never measures row heights
+        self.plugins_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.plugins_table.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+        self.plugins_table.setWordWrap(False)
+        self.plugins_table.setTextElideMode(Qt.ElideRight)
         
         header = self.plugins_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
@@ -152,77 +287,63 @@ class PluginsPage(QWidget):
     
     def _refresh_plugins(self):
         """Refresh the plugins table."""
+        # Nothing to redraw if no plugin was loaded or toggled since last time
+        revision = self.plugin_manager.revision
+        if revision == self._last_plugin_revision:
+            return
+        self._last_plugin_revision = revision
+        
         plugins_info = self.plugin_manager.get_plugin_info()
         self.plugin_count_label.setText(f"{len(plugins_info)} plugins")
         
-        self.plugins_table.setRowCount(len(plugins_info))
+        self.plugins_model.set_plugins(plugins_info)
         
-        for row, info in enumerate(plugins_info):
-            # Enabled checkbox
-            checkbox = QCheckBox()
-            checkbox.setChecked(info["enabled"])
-            checkbox.stateChanged.connect(
-                lambda state, pid=info["id"]: self._on_toggle_plugin(pid, state)
-            )
-            checkbox_widget = QWidget()
-            checkbox_layout = QHBoxLayout(checkbox_widget)
-            checkbox_layout.addWidget(checkbox)
-            checkbox_layout.setAlignment(Qt.AlignCenter)
-            checkbox_layout.setContentsMargins(0, 0, 0, 0)
-            self.plugins_table.setCellWidget(row, 0, checkbox_widget)
-            
-            # Name
-            self.plugins_table.setItem(row, 1, QTableWidgetItem(info["name"]))
-            
-            # Version
-            self.plugins_table.setItem(row, 2, QTableWidgetItem(info["version"]))
-            
-            # Domains
-            domains_text = ", ".join(info["domains"][:3])
-            if len(info["domains"]) > 3:
-                domains_text += f" (+{len(info['domains']) - 3} more)"
-            self.plugins_table.setItem(row, 3, QTableWidgetItem(domains_text))
-            
-            # Author
-            self.plugins_table.setItem(row, 4, QTableWidgetItem(info["author"]))
-            
-            # API Version
-            self.plugins_table.setItem(row, 5, QTableWidgetItem(str(info["api_version"])))
-        
-        # Update errors
+        # Update errors, only re-laying out the text when they changed
         errors = self.plugin_manager.load_errors
+        errors_key = tuple(errors.items())
+        if errors_key == self._last_errors_key:
+            return
+        self._last_errors_key = errors_key
         if errors:
             error_text = "\n\n".join(
-                f"❌ {name}:\n{error}" for name, error in errors.items()
+                f"❌ {name}:\n{self.plugin_manager.format_load_error(name)}"
+                for name in errors
             )
-            self.errors_text.setText(error_text)
+            self.errors_text.setPlainText(error_text)
         else:
             self.errors_text.clear()
     
-    def _on_toggle_plugin(self, plugin_id: str, state: int):
-        """Toggle a plugin's enabled state."""
-        if state == Qt.CheckState.Checked.value:
-            self.plugin_manager.enable_plugin(plugin_id)
-        else:
-            self.plugin_manager.disable_plugin(plugin_id)
-    
     def _on_open_folder(self):
         """Open the plugins folder."""
         folder = self.plugin_manager.plugins_dir
         folder.mkdir(parents=True, exist_ok=True)
         
-        if sys.platform == "win32":
-            subprocess.run(["explorer", str(folder)])
-        elif sys.platform == "darwin":
-            subprocess.run(["open", str(folder)])
-        else:
-            subprocess.run(["xdg-open", str(folder)])
+        # Hands off to the platform file manager without waiting on it
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(folder)))
     
     def _on_reload_plugins(self):
         """Reload all plugins."""
-        count = self.plugin_manager.reload_plugins()
+        # Re-importing plugins can be slow, so it runs off the GUI thread
+        self.reload_btn.setEnabled(False)
+        self.test_result.setText("⏳ Reloading plugins...")
+        self._reload_job = _ReloadJob(self.plugin_manager)
+        self._reload_job.signals.finished.connect(self._on_reload_finished)
+        QThreadPool.globalInstance().start(self._reload_job)
+    
+    def _on_reload_finished(self, result):
+        """Show the outcome of a reload job."""
+        self._reload_job = None
+        self.reload_btn.setEnabled(True)
+        if not isinstance(result, Exception):
+            try:
+                result = self.plugin_manager.finish_reload(result)
+            except Exception as e:
+                result = e
         self._refresh_plugins()
-        self.test_result.setText(f"✅ Reloaded {count} plugin(s)")
+        if isinstance(result, Exception):
+            self.test_result.setText(f"❌ Reload failed:\n\n{result}")
+        else:
+            self.test_result.setText(f"✅ Reloaded {result} plugin(s)")
     
     def _on_test_url(self):
         """Test which plugin handles a URL."""
@@ -231,14 +352,26 @@ class PluginsPage(QWidget):
             self.test_result.setText("⚠️ Please enter a URL to test")
             return
         
-        plugin = self.plugin_manager.get_plugin_for_url(url)
-        
-        if plugin:
+        # Plugin matching runs plugin code, so keep it off the GUI thread
+        self.test_btn.setEnabled(False)
+        self._test_job = _TestUrlJob(self.plugin_manager, url)
+        self._test_job.signals.finished.connect(self._on_test_url_finished)
+        QThreadPool.globalInstance().start(self._test_job)
+    
+    def _on_test_url_finished(self, result: tuple):
+        """Show the result of a URL test job."""
+        self._test_job = None
+        self.test_btn.setEnabled(True)
+        plugin, detail = result
+        
+        if isinstance(detail, Exception):
+            self.test_result.setText(f"❌ Error while testing URL:\n\n{detail}")
+        elif plugin:
             self.test_result.setText(
                 f"✅ URL matched!\n\n"
                 f"Plugin: {plugin.name} v{plugin.version}\n"
                 f"Domains: {', '.join(plugin.supported_domains)}\n"
-                f"Normalized URL: {plugin.normalize_url(url)}"
+                f"Normalized URL: {detail}"
             )
         else:
             self.test_result.setText(
@@ -249,4 +382,12 @@ class PluginsPage(QWidget):
     def showEvent(self, event):
         """Refresh when page is shown."""
         super().showEvent(event)
+        # Populate after the page has painted; repeated shows share one refresh
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._on_deferred_refresh)
+    
+    def _on_deferred_refresh(self):
+        """Run the refresh queued by showEvent."""
+        self._refresh_pending = False
         self._refresh_plugins()
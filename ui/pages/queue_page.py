@@ -1,16 +1,22 @@
 """
 Queue page - main interface for adding URLs and managing downloads.
 """
+from collections import deque
+import datetime
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QPushButton, QLabel, QTextEdit, QTableWidget,
-    QTableWidgetItem, QHeaderView, QFrame, QComboBox,
+    QPushButton, QLabel, QTextEdit, QTableView,
+    QHeaderView, QFrame, QComboBox,
     QDoubleSpinBox, QProgressBar, QPlainTextEdit,
     QFormLayout, QScrollArea, QFileDialog, QCheckBox,
     QSpinBox, QLineEdit, QGroupBox, QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal, Slot, QTimer
-from PySide6.QtGui import QFont
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QTimer, QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool
+)
+from PySide6.QtGui import QFont, QColor
 
 from core import (
     TaskManager, PluginManager, Task, TaskStatus,
@@ -19,6 +25,209 @@ from core import (
 from ..styles import Colors
 
 
+# Most URLs accepted from one paste, unless the "max_pasted_urls" setting
+# overrides it; import a file for larger lists
+MAX_PASTED_URLS = 1000
+
+# Lines kept in the queue's log console
+MAX_LOG_LINES = 500
+
+# Console line prefix for each log level
+_LOG_PREFIXES = {"info": "ℹ️", "warning": "⚠️", "error": "❌", "debug": "🔧"}
+
+# Reads an option widget's value, keyed by the classes _option_widget_type returns
+_OPTION_GETTERS = {
+    QCheckBox: QCheckBox.isChecked,
+    QSpinBox: QSpinBox.value,
+    QDoubleSpinBox: QDoubleSpinBox.value,
+    QComboBox: QComboBox.currentText,
+    QLineEdit: QLineEdit.text,
+}
+
+# Status column text colours, built once
+_STATUS_COLORS: dict[TaskStatus, QColor] = {
+    status: QColor(color) for status, color in {
+        TaskStatus.QUEUED: Colors.TEXT_MUTED,
+        TaskStatus.VALIDATING: Colors.INFO,
+        TaskStatus.READY: Colors.TEXT_PRIMARY,
+        TaskStatus.DOWNLOADING: Colors.INFO,
+        TaskStatus.PAUSED: Colors.WARNING,
+        TaskStatus.COMPLETED: Colors.SUCCESS,
+        TaskStatus.FAILED: Colors.ERROR,
+        TaskStatus.CANCELED: Colors.TEXT_MUTED,
+    }.items()
+}
+_DEFAULT_STATUS_COLOR = QColor(Colors.TEXT_PRIMARY)
+
+
+class _JobSignals(QObject):
+    """Signals for a pool job; delivered to the GUI thread as queued calls."""
+    finished = Signal(object)
+
+
+class _ImportFileJob(QRunnable):
+    """Read a URL list file on a pool thread."""
+    
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = _JobSignals()
+        # Owned by the page until its result arrives
+        self.setAutoDelete(False)
+    
+    def run(self):
+        """Emit finished with the file's text, or the error."""
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                result = f.read()
+        except Exception as e:
+            result = e
+        self.signals.finished.emit(result)
+
+
+class TaskTableModel(QAbstractTableModel):
+    """
+    Table model over the task queue.
+    
+    A row's cell text is formatted once when it is first painted, and event
+    handlers refresh single rows through task_changed() instead of
+    rebuilding the table.
+    """
+    
+    HEADERS = ("Title", "Plugin", "Chapters", "Status", "Progress", "Speed")
+    
+    def __init__(self, plugin_manager: PluginManager, parent=None):
+        super().__init__(parent)
+        self.plugin_manager = plugin_manager
+        self._tasks: list[Task] = []
+        self._rows: dict[str, int] = {}  # task_id -> row
+        # task_id -> progress cells as last painted, see task_changed()
+        self._painted: dict[str, tuple] = {}
+        # task_id -> display text of every column, built on first paint and
+        # dropped whenever the row is repainted, so data() is a tuple index
+        self._row_texts: dict[str, tuple[str, ...]] = {}
+        # plugin_id -> display name, dropped when the plugin list changes
+        self._plugin_names: dict[str, str] = {}
+        self._plugin_revision = plugin_manager.revision
+    
+    def set_tasks(self, tasks: list[Task]) -> None:
+        """Replace all rows."""
+        self.beginResetModel()
+        self._tasks = tasks
+        self._rows = {task.id: row for row, task in enumerate(tasks)}
+        self._painted.clear()
+        self._row_texts.clear()
+        self.endResetModel()
+    
+    def add_tasks(self, tasks: list[Task]) -> None:
+        """Append tasks that aren't shown yet."""
+        new_tasks = [task for task in tasks if task.id not in self._rows]
+        if not new_tasks:
+            return
+        first = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_tasks) - 1)
+        for row, task in enumerate(new_tasks, first):
+            self._tasks.append(task)
+            self._rows[task.id] = row
+        self.endInsertRows()
+    
+    def remove_task(self, task_id: str) -> None:
+        """Drop a task's row, if shown."""
+        row = self._rows.get(task_id)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._tasks[row]
+        del self._rows[task_id]
+        self._painted.pop(task_id, None)
+        self._row_texts.pop(task_id, None)
+        for index in range(row, len(self._tasks)):
+            self._rows[self._tasks[index].id] = index
+        self.endRemoveRows()
+    
+    def task_changed(self, task_id: str, first_column: int = 0, last_column: int = 5) -> None:
+        """
+        Repaint the given columns of a task's row.
+        A progress-only update (from the Status column on) is dropped when
+        the status text, percentage and speed shown are all unchanged.
+        """
+        row = self._rows.get(task_id)
+        if row is None:
+            return
+        task = self._tasks[row]
+        shown = (task.status, task.completed_chapters, task.total_chapters, task.progress_percent, task.speed)
+        if first_column >= 3 and self._painted.get(task_id) == shown:
+            return
+        self._painted[task_id] = shown
+        self._row_texts.pop(task_id, None)
+        self.dataChanged.emit(self.index(row, first_column), self.index(row, last_column))
+    
+    def task_at(self, row: int) -> Task | None:
+        return self._tasks[row] if 0 <= row < len(self._tasks) else None
+    
+    def row_of(self, task_id: str) -> int | None:
+        return self._rows.get(task_id)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tasks)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        task = self._tasks[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if self.plugin_manager.revision != self._plugin_revision:
+                # Plugin names may have changed; rebuild rows as they're painted
+                self._plugin_names.clear()
+                self._row_texts.clear()
+                self._plugin_revision = self.plugin_manager.revision
+            texts = self._row_texts.get(task.id)
+            if texts is None:
+                texts = self._row_texts[task.id] = self._row_text(task)
+            return texts[column]
+        elif role == Qt.ForegroundRole and column == 3:
+            return _STATUS_COLORS.get(task.status, _DEFAULT_STATUS_COLOR)
+        elif role == Qt.UserRole and column == 0:
+            return task.id
+        return None
+    
+    def _row_text(self, task: Task) -> tuple[str, ...]:
+        """Display text for each column of a task's row."""
+        if task.manga_info:
+            ch_min, ch_max = task.manga_info.chapter_range
+            chapters = f"{task.selection.chapter_start or ch_min} - {task.selection.chapter_end or ch_max}"
+        else:
+            chapters = "-"
+        return (
+            task.display_title,
+            self._plugin_name(task.plugin_id),
+            chapters,
+            task.status_text,
+            f"{task.progress_percent}%",
+            task.speed or "-",
+        )
+    
+    def _plugin_name(self, plugin_id: str | None) -> str:
+        """Display name of a task's plugin, cached per plugin id (see data())."""
+        if not plugin_id:
+            return "Unknown"
+        name = self._plugin_names.get(plugin_id)
+        if name is None:
+            plugin = self.plugin_manager.get_plugin(plugin_id)
+            name = self._plugin_names[plugin_id] = plugin.name if plugin else "Unknown"
+        return name
+
+
 class QueuePage(QWidget):
     """Main queue management page."""
     
@@ -28,18 +237,37 @@ class QueuePage(QWidget):
         self.task_manager = task_manager
         self.plugin_manager = plugin_manager
         self.settings = settings
-        self.event_bus = EventBus()
+        self.event_bus = EventBus.instance()
         
         self.current_task_id: str | None = None
+        self._import_job: _ImportFileJob | None = None
+        self._columns_fitted = False
         self._option_widgets: dict = {}
+        # What the details panel last rendered, so repeat updates for the
+        # same task leave the widgets (and any unapplied edits) alone
+        self._last_range_key: tuple | None = None
+        self._last_teams_key: tuple[str, int] | None = None
+        self._last_options_key: tuple | None = None
+        # task_id -> (plugin, manga_info, schema) the schema was built from
+        self._schemas: dict[str, tuple] = {}
+        self._options_refresh_pending = False
+        # Set when an update was skipped because the details panel was hidden
+        self._details_stale = False
+        # task_id -> (first, last) columns to repaint on the next flush
+        self._dirty_tasks: dict[str, tuple[int, int]] = {}
+        self._flush_pending = False
+        # Everything the log console shows; the deque drops the oldest line
+        # itself, and the console is rewritten from it on each flush
+        self._log_lines: deque[str] = deque(maxlen=MAX_LOG_LINES)
+        self._log_dirty = False
+        self._log_flush_pending = False
+        self._now = datetime.datetime.now
+        # "debug" also shows per-selection diagnostics; "info" drops them unformatted
+        self._log_level_threshold = "info"
         
         self._setup_ui()
         self._connect_events()
-        
-        # Refresh timer
-        self._refresh_timer = QTimer(self)
-        self._refresh_timer.timeout.connect(self._refresh_task_list)
-        self._refresh_timer.start(500)
+        self._refresh_task_list()
     
     def _setup_ui(self):
         """Setup the page UI."""
@@ -73,10 +301,12 @@ class QueuePage(QWidget):
         middle_splitter.addWidget(task_table_widget)
         
         # Details panel
-        details_panel = self._create_details_panel()
-        middle_splitter.addWidget(details_panel)
+        self.details_panel = self._create_details_panel()
+        middle_splitter.addWidget(self.details_panel)
         
         middle_splitter.setSizes([600, 400])
+        # Catch the panel being dragged back open after a collapse
+        middle_splitter.splitterMoved.connect(lambda *_: self._refresh_stale_details())
         main_splitter.addWidget(middle_splitter)
         
         # Bottom section: Log console (resizable via splitter)
@@ -85,6 +315,8 @@ class QueuePage(QWidget):
         
         # Set initial sizes: main content gets more space, log gets less
         main_splitter.setSizes([500, 150])
+        # Show lines buffered while the console was collapsed
+        main_splitter.splitterMoved.connect(lambda *_: self._flush_log())
         
         container_layout.addWidget(main_splitter, stretch=1)
         layout.addWidget(container)
@@ -162,7 +394,7 @@ class QueuePage(QWidget):
         header_layout.addWidget(header_label)
         
         self.queue_count_label = QLabel("0 items")
-        self.queue_count_label.setStyleSheet(f"color: {Colors.TEXT_MUTED};")
+        self.queue_count_label.setObjectName("count_label")
         header_layout.addWidget(self.queue_count_label)
         
         header_layout.addStretch()
@@ -175,11 +407,9 @@ class QueuePage(QWidget):
         layout.addLayout(header_layout)
         
         # Table
-        self.task_table = QTableWidget()
-        self.task_table.setColumnCount(6)
-        self.task_table.setHorizontalHeaderLabels([
-            "Title", "Plugin", "Chapters", "Status", "Progress", "Speed"
-        ])
+        self.task_model = TaskTableModel(self.plugin_manager, self)
+        self.task_table = QTableView()
+        self.task_table.setModel(self.task_model)
         
         # Configure table
         self.task_table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -192,14 +422,23 @@ class QueuePage(QWidget):
         # Column sizing
         header = self.task_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        # Plugin and chapters are user-sizable and fitted to their contents
+        # once, after the first populate (see _refresh_task_list); with
+        # ResizeToContents every row change re-measured the whole column
+        header.setSectionResizeMode(1, QHeaderView.Interactive)
+        header.resizeSection(1, 140)
+        header.setSectionResizeMode(2, QHeaderView.Interactive)
+        header.resizeSection(2, 100)
+        # Status, progress and speed change on every progress event, so they
+        # get fixed widths; ResizeToContents would re-measure them each time
+        header.setSectionResizeMode(3, QHeaderView.Fixed)
+        header.resizeSection(3, 170)
         header.setSectionResizeMode(4, QHeaderView.Fixed)
         header.resizeSection(4, 120)
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(5, QHeaderView.Fixed)
+        header.resizeSection(5, 100)
         
-        self.task_table.itemSelectionChanged.connect(self._on_task_selected)
+        self.task_table.selectionModel().selectionChanged.connect(self._on_task_selected)
         
         layout.addWidget(self.task_table)
         
@@ -232,13 +471,13 @@ class QueuePage(QWidget):
         
         # Title
         self.detail_title = QLabel("Select a task to view details")
-        self.detail_title.setStyleSheet(f"font-size: 16px; font-weight: 600; color: {Colors.TEXT_PRIMARY};")
+        self.detail_title.setObjectName("detail_title")
         self.detail_title.setWordWrap(True)
         self.details_layout.addWidget(self.detail_title)
         
         # URL
         self.detail_url = QLabel("")
-        self.detail_url.setStyleSheet(f"color: {Colors.TEXT_MUTED}; font-size: 11px;")
+        self.detail_url.setObjectName("hint_label")
         self.detail_url.setWordWrap(True)
         self.details_layout.addWidget(self.detail_url)
         
@@ -349,7 +588,6 @@ class QueuePage(QWidget):
         self.log_output = QPlainTextEdit()
         self.log_output.setObjectName("log_console")
         self.log_output.setReadOnly(True)
-        self.log_output.setMaximumBlockCount(500)
         layout.addWidget(self.log_output)
         
         return section
@@ -372,11 +610,18 @@ class QueuePage(QWidget):
         if not text:
             return
         
-        tasks = self.task_manager.add_tasks_from_text(text)
+        # Trim and de-duplicate in one pass, keeping paste order
+        lines = list(dict.fromkeys(filter(None, map(str.strip, text.splitlines()))))
+        max_urls = self.settings.get("max_pasted_urls", MAX_PASTED_URLS)
+        if len(lines) > max_urls:
+            self._log(f"Only the first {max_urls} of {len(lines)} pasted URLs were added", "warning")
+            del lines[max_urls:]
+        
+        tasks = self.task_manager.add_tasks_from_text("\n".join(lines))
         self.url_input.clear()
         
+        # Rows are inserted by the batched TASK_ADDED event
         self._log(f"Added {len(tasks)} URL(s) to queue")
-        self._refresh_task_list()
     
     def _on_import_file(self):
         """Handle import file button click."""
@@ -384,14 +629,25 @@ class QueuePage(QWidget):
             self, "Import URLs", "", "Text Files (*.txt);;All Files (*)"
         )
         if file_path:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    text = f.read()
-                tasks = self.task_manager.add_tasks_from_text(text)
-                self._log(f"Imported {len(tasks)} URL(s) from file")
-                self._refresh_task_list()
-            except Exception as e:
-                self._log(f"Error importing file: {e}", "error")
+            # Large URL dumps would block painting, so the read runs off the GUI thread
+            self.import_btn.setEnabled(False)
+            self.import_btn.setText("Importing...")
+            self._import_job = _ImportFileJob(file_path)
+            self._import_job.signals.finished.connect(self._on_import_finished)
+            QThreadPool.globalInstance().start(self._import_job)
+    
+    def _on_import_finished(self, result):
+        """Queue the URLs read by an import job."""
+        self._import_job = None
+        self.import_btn.setEnabled(True)
+        self.import_btn.setText("Import .txt")
+        try:
+            if isinstance(result, Exception):
+                raise result
+            tasks = self.task_manager.add_tasks_from_text(result)
+            self._log(f"Imported {len(tasks)} URL(s) from file")
+        except Exception as e:
+            self._log(f"Error importing file: {e}", "error")
     
     def _on_validate_all(self):
         """Validate all queued tasks."""
@@ -409,19 +665,17 @@ class QueuePage(QWidget):
         self._log(f"Cleared {count} completed task(s)")
         self._refresh_task_list()
     
-    def _on_task_selected(self):
+    def _on_task_selected(self, selected, deselected):
         """Handle task selection in table."""
-        selected = self.task_table.selectedItems()
-        if not selected:
+        # Single row selection, so the newly selected range is the whole
+        # selection and its row maps straight into the model's task list
+        task = self.task_model.task_at(selected[0].top()) if not selected.isEmpty() else None
+        if task is None:
             self.current_task_id = None
             self._update_details_panel(None)
             return
         
-        row = selected[0].row()
-        task_id = self.task_table.item(row, 0).data(Qt.UserRole)
-        self.current_task_id = task_id
-        
-        task = self.task_manager.get_task(task_id)
+        self.current_task_id = task.id
         self._update_details_panel(task)
     
     def _on_fetch_info(self):
@@ -447,17 +701,9 @@ class QueuePage(QWidget):
         
         # Update plugin options
         for key, widget in self._option_widgets.items():
-            if isinstance(widget, QCheckBox):
-                task.options[key] = widget.isChecked()
-            elif isinstance(widget, QSpinBox):
-                task.options[key] = widget.value()
-            elif isinstance(widget, QDoubleSpinBox):
-                task.options[key] = widget.value()
-            elif isinstance(widget, QComboBox):
-                task.options[key] = widget.currentText()
-            elif isinstance(widget, QLineEdit):
-                task.options[key] = widget.text()
+            task.options[key] = _OPTION_GETTERS[type(widget)](widget)
         
+        self.task_model.task_changed(task.id, 2, 2)
         self._log(f"Applied options to: {task.display_title}")
     
     def _on_download_task(self):
@@ -484,21 +730,27 @@ class QueuePage(QWidget):
     
     def _on_clear_log(self):
         """Clear log output."""
+        self._log_lines.clear()
+        self._log_dirty = False
         self.log_output.clear()
     
     # ==================== Event Bus Handlers ====================
     
     def _on_event_task_added(self, event: Event):
-        self._refresh_task_list()
+        payload = event.payload
+        task_ids = payload.get("task_ids") or [payload.get("task_id")]
+        get_task = self.task_manager.get_task
+        self.task_model.add_tasks([task for task in map(get_task, task_ids) if task])
+        self._update_queue_count()
+        self._fit_columns()
     
     def _on_event_task_updated(self, event: Event):
-        self._refresh_task_list()
-        if event.payload.get("task_id") == self.current_task_id:
-            task = self.task_manager.get_task(self.current_task_id)
-            self._update_details_panel(task)
+        self._mark_task_dirty(event.payload.get("task_id"), 0, 5)
     
     def _on_event_task_removed(self, event: Event):
-        self._refresh_task_list()
+        self.task_model.remove_task(event.payload.get("task_id"))
+        self._schemas.pop(event.payload.get("task_id"), None)
+        self._update_queue_count()
     
     def _on_event_log(self, event: Event):
         level = event.payload.get("level", "info")
@@ -506,59 +758,80 @@ class QueuePage(QWidget):
         self._log(message, level)
     
     def _on_event_download_progress(self, event: Event):
-        pass  # Handled by refresh timer
+        # Progress events also stand in for TASK_UPDATED while downloading;
+        # only status, progress and speed change
+        self._mark_task_dirty(event.payload.get("task_id"), 3, 5)
+    
+    def _mark_task_dirty(self, task_id: str, first_column: int, last_column: int):
+        """
+        Queue a repaint of a task's row. Updates arriving within 50ms are
+        merged, so a burst of events costs one repaint per row.
+        """
+        dirty = self._dirty_tasks.get(task_id)
+        if dirty:
+            first_column = min(first_column, dirty[0])
+            last_column = max(last_column, dirty[1])
+        self._dirty_tasks[task_id] = (first_column, last_column)
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(50, self._flush_dirty_tasks)
+    
+    def _flush_dirty_tasks(self):
+        """Repaint the rows queued by _mark_task_dirty."""
+        self._flush_pending = False
+        dirty, self._dirty_tasks = self._dirty_tasks, {}
+        task_changed = self.task_model.task_changed
+        for task_id, (first_column, last_column) in dirty.items():
+            task_changed(task_id, first_column, last_column)
+        if self.current_task_id in dirty:
+            task = self.task_manager.get_task(self.current_task_id)
+            self._update_details_panel(task)
     
     # ==================== UI Updates ====================
     
+    def showEvent(self, event):
+        """Bring the details panel and log up to date when the page is shown."""
+        super().showEvent(event)
+        self._refresh_stale_details()
+        self._flush_log()
+    
+    def _refresh_stale_details(self):
+        """Apply a details update that was skipped while the panel was hidden."""
+        if self._details_stale:
+            task = self.task_manager.get_task(self.current_task_id) if self.current_task_id else None
+            self._update_details_panel(task)
+    
     def _refresh_task_list(self):
-        """Refresh the task table."""
-        tasks = self.task_manager.get_all_tasks()
-        self.queue_count_label.setText(f"{len(tasks)} items")
-        
-        # Remember selection
+        """Reload the whole task table from the task manager."""
         selected_id = self.current_task_id
-        
-        # Update table
-        self.task_table.setRowCount(len(tasks))
-        
-        for row, task in enumerate(tasks):
-            # Title
-            title_item = QTableWidgetItem(task.display_title)
-            title_item.setData(Qt.UserRole, task.id)
-            self.task_table.setItem(row, 0, title_item)
-            
-            # Plugin
-            plugin = self.plugin_manager.get_plugin(task.plugin_id) if task.plugin_id else None
-            plugin_name = plugin.name if plugin else "Unknown"
-            self.task_table.setItem(row, 1, QTableWidgetItem(plugin_name))
-            
-            # Chapters
-            if task.manga_info:
-                ch_min, ch_max = task.manga_info.chapter_range
-                chapters_text = f"{task.selection.chapter_start or ch_min} - {task.selection.chapter_end or ch_max}"
-            else:
-                chapters_text = "-"
-            self.task_table.setItem(row, 2, QTableWidgetItem(chapters_text))
-            
-            # Status
-            status_item = QTableWidgetItem(task.status_text)
-            status_color = self._get_status_color(task.status)
-            status_item.setForeground(status_color)
-            self.task_table.setItem(row, 3, status_item)
-            
-            # Progress
-            progress_item = QTableWidgetItem(f"{task.progress_percent}%")
-            self.task_table.setItem(row, 4, progress_item)
-            
-            # Speed
-            self.task_table.setItem(row, 5, QTableWidgetItem(task.speed or "-"))
-            
-            # Restore selection
-            if task.id == selected_id:
-                self.task_table.selectRow(row)
+        self.task_model.set_tasks(self.task_manager.get_all_tasks())
+        self._update_queue_count()
+        self._fit_columns()
+        
+        # Restore selection
+        row = self.task_model.row_of(selected_id) if selected_id else None
+        if row is not None:
+            self.task_table.selectRow(row)
+    
+    def _fit_columns(self):
+        """Size the text columns to the first rows shown."""
+        if not self._columns_fitted and self.task_model.rowCount():
+            self._columns_fitted = True
+            self.task_table.resizeColumnToContents(1)
+            self.task_table.resizeColumnToContents(2)
+    
+    def _update_queue_count(self):
+        """Show the number of queued tasks."""
+        self.queue_count_label.setText(f"{self.task_model.rowCount()} items")
     
     def _update_details_panel(self, task: Task | None):
         """Update the details panel for a task."""
+        # Hidden page or collapsed pane: catch up when it's shown again
+        if not self.details_panel.isVisible() or self.details_panel.width() == 0:
+            self._details_stale = True
+            return
+        self._details_stale = False
+        
         if not task:
             self.detail_title.setText("Select a task to view details")
             self.detail_url.setText("")
@@ -567,6 +840,7 @@ class QueuePage(QWidget):
             self.team_combo.clear()
             self.team_combo.addItem("All Teams", None)
             self._clear_options()
+            self._last_range_key = self._last_teams_key = self._last_options_key = None
             return
         
         # Update basic info
@@ -576,33 +850,43 @@ class QueuePage(QWidget):
         # Update chapter range
         if task.manga_info:
             ch_min, ch_max = task.manga_info.chapter_range
-            self.chapter_start.setRange(ch_min, ch_max)
-            self.chapter_end.setRange(ch_min, ch_max)
-            self.chapter_start.setValue(task.selection.chapter_start or ch_min)
-            self.chapter_end.setValue(task.selection.chapter_end or ch_max)
+            range_key = (task.id, ch_min, ch_max)
+            if range_key != self._last_range_key:
+                self._last_range_key = range_key
+                self.chapter_start.setRange(ch_min, ch_max)
+                self.chapter_end.setRange(ch_min, ch_max)
+                self.chapter_start.setValue(task.selection.chapter_start or ch_min)
+                self.chapter_end.setValue(task.selection.chapter_end or ch_max)
             
             # Update teams
-            self.team_combo.clear()
-            self.team_combo.addItem("All Teams", None)
-            self._log(f"Loading {len(task.manga_info.translation_teams)} translation team(s)")
-            for team in task.manga_info.translation_teams:
-                self.team_combo.addItem(str(team), team.id)
-                self._log(f"  Added team: {team.name}")
-            
-            # Select current team
-            if task.selection.translation_team_id:
-                for i in range(self.team_combo.count()):
-                    if self.team_combo.itemData(i) == task.selection.translation_team_id:
-                        self.team_combo.setCurrentIndex(i)
-                        break
-        else:
+            teams = task.manga_info.translation_teams
+            teams_key = (task.id, hash(tuple((t.id, t.name) for t in teams)))
+            if teams_key != self._last_teams_key:
+                self._last_teams_key = teams_key
+                self.team_combo.clear()
+                self.team_combo.addItem("All Teams", None)
+                for team in teams:
+                    self.team_combo.addItem(str(team), team.id)
+                self._log(f"Loaded {len(teams)} translation team(s)", "debug")
+                
+                # Select current team
+                if task.selection.translation_team_id:
+                    for i in range(self.team_combo.count()):
+                        if self.team_combo.itemData(i) == task.selection.translation_team_id:
+                            self.team_combo.setCurrentIndex(i)
+                            break
+        elif self._last_range_key is not None or self._last_teams_key is not None:
             self.chapter_start.setValue(0)
             self.chapter_end.setValue(0)
             self.team_combo.clear()
             self.team_combo.addItem("All Teams", None)
+            self._last_range_key = self._last_teams_key = None
         
         # Update plugin options
-        self._update_options(task)
+        # Building the form can be slow; let the current repaint finish first
+        if not self._options_refresh_pending:
+            self._options_refresh_pending = True
+            QTimer.singleShot(0, self._on_deferred_options_refresh)
         
         # Update button states
         is_downloading = task.status == TaskStatus.DOWNLOADING
@@ -614,35 +898,71 @@ class QueuePage(QWidget):
         self.pause_btn.setText("Resume" if is_paused else "Pause")
         self.cancel_btn.setEnabled(is_downloading or is_paused)
     
+    def _on_deferred_options_refresh(self):
+        """Run the options update queued by _update_details_panel."""
+        self._options_refresh_pending = False
+        task = self.task_manager.get_task(self.current_task_id) if self.current_task_id else None
+        if task:
+            self._update_options(task)
+    
     def _update_options(self, task: Task):
         """Update plugin options form."""
-        self._clear_options()
-        
         if not task.plugin_id or not task.manga_info:
-            self._log(f"Options: No plugin_id ({task.plugin_id}) or manga_info ({task.manga_info is not None})")
+            self._clear_options()
+            self._last_options_key = None
+            self._log(f"Options: No plugin_id ({task.plugin_id}) or manga_info ({task.manga_info is not None})", "debug")
             return
         
         plugin = self.plugin_manager.get_plugin(task.plugin_id)
         if not plugin:
-            self._log(f"Options: Plugin not found for id: {task.plugin_id}")
+            self._clear_options()
+            self._last_options_key = None
+            self._log(f"Options: Plugin not found for id: {task.plugin_id}", "debug")
             return
         
-        schema = plugin.get_options_schema(task.manga_info)
-        self._log(f"Options: Loaded {len(schema.fields)} option(s) from {plugin.name}")
+        # Reuse the schema until the task's plugin or manga info is replaced
+        cached = self._schemas.get(task.id)
+        if cached and cached[0] is plugin and cached[1] is task.manga_info:
+            schema = cached[2]
+        else:
+            schema = plugin.get_options_schema(task.manga_info)
+            self._schemas[task.id] = (plugin, task.manga_info, schema)
+        options_key = (
+            task.id,
+            task.plugin_id,
+            tuple((f.key, f.field_type, tuple(f.choices)) for f in schema.fields),
+        )
+        if options_key == self._last_options_key:
+            return
+        self._last_options_key = options_key
+        self._log(f"Options: Loaded {len(schema.fields)} option(s) from {plugin.name}", "debug")
+        
+        # Keep widgets whose key and kind still match, drop the rest
+        widgets = self._option_widgets
+        wanted = {field.key: self._option_widget_type(field) for field in schema.fields}
+        for key in [k for k, w in widgets.items() if type(w) is not wanted.get(k)]:
+            self.options_layout.removeRow(widgets.pop(key))
+        # Lift the kept rows out so every row is re-added in schema order
+        labels = {
+            key: self.options_layout.takeRow(widget).labelItem.widget()
+            for key, widget in widgets.items()
+        }
         
         for field in schema.fields:
-            widget = None
+            widget = widgets.get(field.key)
+            created = widget is None
+            if created:
+                widget_type = wanted[field.key]
+                if widget_type is None:
+                    continue
+                widget = widget_type()
             
             if field.field_type == FieldType.CHECKBOX:
-                widget = QCheckBox()
                 widget.setChecked(task.options.get(field.key, field.default or False))
                 
             elif field.field_type == FieldType.NUMBER:
-                if field.step and field.step < 1:
-                    widget = QDoubleSpinBox()
+                if created and isinstance(widget, QDoubleSpinBox):
                     widget.setDecimals(2)
-                else:
-                    widget = QSpinBox()
                 if field.min_value is not None:
                     widget.setMinimum(int(field.min_value))
                 if field.max_value is not None:
@@ -650,20 +970,36 @@ class QueuePage(QWidget):
                 widget.setValue(task.options.get(field.key, field.default or 0))
                 
             elif field.field_type == FieldType.DROPDOWN:
-                widget = QComboBox()
-                for choice in field.choices:
-                    widget.addItem(choice)
+                if not created:
+                    widget.clear()
+                widget.addItems(field.choices)
                 current = task.options.get(field.key, field.default)
                 if current in field.choices:
                     widget.setCurrentText(current)
                     
             elif field.field_type == FieldType.TEXT:
-                widget = QLineEdit()
                 widget.setText(task.options.get(field.key, field.default or ""))
             
-            if widget:
-                self._option_widgets[field.key] = widget
+            if created:
+                widgets[field.key] = widget
                 self.options_layout.addRow(field.label + ":", widget)
+            else:
+                label = labels[field.key]
+                label.setText(field.label + ":")
+                self.options_layout.addRow(label, widget)
+    
+    @staticmethod
+    def _option_widget_type(field) -> type | None:
+        """Widget class used to edit an option field."""
+        if field.field_type == FieldType.CHECKBOX:
+            return QCheckBox
+        if field.field_type == FieldType.NUMBER:
+            return QDoubleSpinBox if field.step and field.step < 1 else QSpinBox
+        if field.field_type == FieldType.DROPDOWN:
+            return QComboBox
+        if field.field_type == FieldType.TEXT:
+            return QLineEdit
+        return None
     
     def _clear_options(self):
         """Clear plugin options form."""
@@ -673,34 +1009,31 @@ class QueuePage(QWidget):
                 item.widget().deleteLater()
         self._option_widgets.clear()
     
-    def _get_status_color(self, status: TaskStatus):
-        """Get color for task status."""
-        from PySide6.QtGui import QColor
-        color_map = {
-            TaskStatus.QUEUED: Colors.TEXT_MUTED,
-            TaskStatus.VALIDATING: Colors.INFO,
-            TaskStatus.READY: Colors.TEXT_PRIMARY,
-            TaskStatus.DOWNLOADING: Colors.INFO,
-            TaskStatus.PAUSED: Colors.WARNING,
-            TaskStatus.COMPLETED: Colors.SUCCESS,
-            TaskStatus.FAILED: Colors.ERROR,
-            TaskStatus.CANCELED: Colors.TEXT_MUTED,
-        }
-        return QColor(color_map.get(status, Colors.TEXT_PRIMARY))
-    
     def _log(self, message: str, level: str = "info"):
         """Add a log message."""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        
-        color_map = {
-            "info": Colors.TEXT_SECONDARY,
-            "warning": Colors.WARNING,
-            "error": Colors.ERROR,
-            "debug": Colors.TEXT_MUTED,
-        }
-        color = color_map.get(level, Colors.TEXT_SECONDARY)
-        
-        # Simple text append (HTML for colors would require QTextEdit)
-        prefix = {"info": "ℹ️", "warning": "⚠️", "error": "❌", "debug": "🔧"}.get(level, "")
-        self.log_output.appendPlainText(f"[{timestamp}] {prefix} {message}")
+        if level == "debug" and self._log_level_threshold != "debug":
+            return
+        t = self._now()
+        timestamp = f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+        prefix = _LOG_PREFIXES.get(level, "")
+        self._log_lines.append(f"[{timestamp}] {prefix} {message}")
+        self._log_dirty = True
+        # Lines logged within 100ms are shown, and laid out, together
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            QTimer.singleShot(100, self._flush_log)
+    
+    def _flush_log(self):
+        """Rewrite the console from the buffered log lines."""
+        self._log_flush_pending = False
+        # Hidden or collapsed console: keep buffering until it can be seen again
+        if not self._log_dirty or not self.log_output.isVisible() or self.log_output.height() == 0:
+            return
+        self._log_dirty = False
+        
+        # Follow new lines only if the user hasn't scrolled up to read
+        scroll_bar = self.log_output.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum()
+        position = scroll_bar.value()
+        self.log_output.setPlainText("\n".join(self._log_lines))
+        scroll_bar.setValue(scroll_bar.maximum() if at_bottom else position)
@@ -7,11 +7,68 @@ from PySide6.QtWidgets import (
     QDoubleSpinBox, QFileDialog, QGroupBox,
     QFormLayout, QCheckBox, QScrollArea
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal, QTimer, QObject, QRunnable, QThreadPool
 from pathlib import Path
+from typing import Optional
 import json
+import os
 
-from ..styles import Colors
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Optional speedup; stdlib json parses the same bytes
+    _json_loads = json.loads
+
+# Default settings, built once; values are immutable so a shallow copy is safe
+_DEFAULTS = {
+    "download_folder": str(Path.home() / "Downloads" / "MangaDL"),
+    "max_parallel_downloads": 16,
+    "chapter_folders": True,
+    "overwrite_existing": False,
+    "retry_count": 3,
+    "timeout": 30,
+    "rate_limit": 0.5,
+    "user_agent": "",
+    "chapter_format": "{manga_title}/Chapter {chapter_number}",
+    "page_format": "{page_number:03d}",
+    "show_notifications": True,
+    "minimize_to_tray": False,
+}
+
+
+class _JobSignals(QObject):
+    """Signals for a pool job; delivered to the GUI thread as queued calls."""
+    finished = Signal(object)
+
+
+class _SaveSettingsJob(QRunnable):
+    """Write a settings snapshot to disk on a pool thread."""
+    
+    def __init__(self, path: str, settings: dict):
+        super().__init__()
+        self.path = path
+        self.settings = settings
+        self.signals = _JobSignals()
+        # Owned by the page until its result arrives
+        self.setAutoDelete(False)
+    
+    def run(self):
+        """Emit finished with None, or the error."""
+        try:
+            # json.dump writes chunk by chunk; encode first, then write once.
+            # Written beside the real file and renamed over it, so a crash
+            # mid-save leaves the previous settings intact.
+            data = json.dumps(self.settings, indent=2)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            result = None
+        except Exception as e:
+            result = e
+        self.signals.finished.emit(result)
 
 
 class SettingsPage(QWidget):
@@ -19,14 +76,49 @@ class SettingsPage(QWidget):
     
     SETTINGS_FILE = "settings.json"
     
+    # Last parsed settings file, shared by all pages; re-read only when the
+    # file's key (see _file_key) changes. "data" is never mutated, only copied from.
+    _cache: dict = {"key": None, "data": None}
+    
+    # Every form-backed setting: (widget attribute, settings key, fallback,
+    # getter, setter). _on_save and _apply_settings are both driven by it.
+    _FIELDS = (
+        ("download_folder", "download_folder", "", "text", "setText"),
+        ("max_parallel", "max_parallel_downloads", 16, "value", "setValue"),
+        ("chapter_folders", "chapter_folders", True, "isChecked", "setChecked"),
+        ("overwrite_existing", "overwrite_existing", False, "isChecked", "setChecked"),
+        ("retry_count", "retry_count", 3, "value", "setValue"),
+        ("timeout", "timeout", 30, "value", "setValue"),
+        ("rate_limit", "rate_limit", 0.5, "value", "setValue"),
+        ("user_agent", "user_agent", "", "text", "setText"),
+        ("chapter_format", "chapter_format", "{manga_title}/Chapter {chapter_number}", "text", "setText"),
+        ("page_format", "page_format", "{page_number:03d}", "text", "setText"),
+        ("show_notifications", "show_notifications", True, "isChecked", "setChecked"),
+        ("minimize_to_tray", "minimize_to_tray", False, "isChecked", "setChecked"),
+    )
+    
+    # Change signal for each getter in _FIELDS, used to track unsaved edits
+    _CHANGE_SIGNALS = {"text": "textChanged", "value": "valueChanged", "isChecked": "toggled"}
+    
+    # Emitted after settings are loaded or saved
+    settings_changed = Signal()
+    
     def __init__(self, settings: dict):
         super().__init__()
         self.settings = settings
+        # The form is built the first time the page is shown
+        self._body_built = False
+        self._build_pending = False
+        self._save_job: Optional[_SaveSettingsJob] = None
+        # Set when Save is clicked while a write is still running
+        self._save_again = False
+        # True once the form holds values that haven't been saved
+        self._dirty = False
         self._setup_ui()
         self._load_settings()
     
     def _setup_ui(self):
-        """Setup the page UI."""
+        """Setup the page shell: title and an empty scroll area."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -40,7 +132,40 @@ class SettingsPage(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
-        
+        # The form widget fills the viewport and paints its own background,
+        # so the viewport needn't erase first or repaint on growth
+        viewport = scroll.viewport()
+        viewport.setAttribute(Qt.WA_OpaquePaintEvent)
+        viewport.setAttribute(Qt.WA_StaticContents)
+        self._scroll = scroll
+        layout.addWidget(scroll)
+    
+    def showEvent(self, event):
+        """Build the settings form on first show."""
+        super().showEvent(event)
+        # Build after the page has painted; repeated shows share one build
+        if not self._body_built and not self._build_pending:
+            self._build_pending = True
+            QTimer.singleShot(0, self._on_deferred_build)
+    
+    def _on_deferred_build(self):
+        """Run the build queued by showEvent."""
+        self._build_pending = False
+        if self._body_built:
+            return
+        self._setup_body()
+        self._body_built = True
+        self._apply_settings(self.settings)
+        # _apply_settings blocks signals, so only user edits mark the form dirty
+        for attr, _, _, getter, _ in self._FIELDS:
+            getattr(getattr(self, attr), self._CHANGE_SIGNALS[getter]).connect(self._mark_dirty)
+    
+    def _mark_dirty(self, *_):
+        """Note that the form has unsaved changes."""
+        self._dirty = True
+    
+    def _setup_body(self):
+        """Build the settings form inside the scroll area."""
         content = QWidget()
         content_layout = QVBoxLayout(content)
         content_layout.setContentsMargins(25, 10, 25, 25)
@@ -66,8 +191,8 @@ class SettingsPage(QWidget):
         
         # Max parallel downloads
         self.max_parallel = QSpinBox()
-        self.max_parallel.setRange(1, 10)
-        self.max_parallel.setValue(3)
+        self.max_parallel.setRange(1, 64)
+        self.max_parallel.setValue(16)
         download_layout.addRow("Max Parallel Downloads:", self.max_parallel)
         
         # Create chapter folders
@@ -137,7 +262,7 @@ class SettingsPage(QWidget):
             "Available variables: {manga_title}, {chapter_number}, {chapter_title}, "
             "{page_number}, {translation_team}"
         )
-        format_help.setStyleSheet(f"color: {Colors.TEXT_MUTED}; font-size: 11px;")
+        format_help.setObjectName("hint_label")
         format_help.setWordWrap(True)
         naming_layout.addRow("", format_help)
         
@@ -180,8 +305,7 @@ class SettingsPage(QWidget):
         
         content_layout.addLayout(button_layout)
         
-        scroll.setWidget(content)
-        layout.addWidget(scroll)
+        self._scroll.setWidget(content)
     
     def _on_browse_folder(self):
         """Browse for download folder."""
@@ -194,74 +318,93 @@ class SettingsPage(QWidget):
     
     def _on_save(self):
         """Save settings."""
-        self.settings["download_folder"] = self.download_folder.text()
-        self.settings["max_parallel_downloads"] = self.max_parallel.value()
-        self.settings["chapter_folders"] = self.chapter_folders.isChecked()
-        self.settings["overwrite_existing"] = self.overwrite_existing.isChecked()
-        self.settings["retry_count"] = self.retry_count.value()
-        self.settings["timeout"] = self.timeout.value()
-        self.settings["rate_limit"] = self.rate_limit.value()
-        self.settings["user_agent"] = self.user_agent.text()
-        self.settings["chapter_format"] = self.chapter_format.text()
-        self.settings["page_format"] = self.page_format.text()
-        self.settings["show_notifications"] = self.show_notifications.isChecked()
-        self.settings["minimize_to_tray"] = self.minimize_to_tray.isChecked()
-        
-        # Save to file
-        try:
-            with open(self.SETTINGS_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.settings, f, indent=2)
-        except Exception as e:
-            print(f"Error saving settings: {e}")
+        # Nothing edited since the last save: skip the encode and write
+        if not self._dirty:
+            return
+        self._dirty = False
+        self.settings.update({
+            key: getattr(getattr(self, attr), getter)()
+            for attr, key, _, getter, _ in self._FIELDS
+        })
+        
+        # Save to file off the GUI thread; one write at a time, and the
+        # newest values are written once the current write finishes
+        if self._save_job is None:
+            self._start_save()
+        else:
+            self._save_again = True
+        
+        self.settings_changed.emit()
+    
+    def _start_save(self):
+        """Write a snapshot of the current settings on a pool thread."""
+        self._save_job = _SaveSettingsJob(self.SETTINGS_FILE, dict(self.settings))
+        self._save_job.signals.finished.connect(self._on_save_finished)
+        QThreadPool.globalInstance().start(self._save_job)
+    
+    def _on_save_finished(self, error):
+        """Record a finished write and start the next one, if Save was clicked again."""
+        job, self._save_job = self._save_job, None
+        if error is not None:
+            print(f"Error saving settings: {error}")
+            # Let the next Save click retry
+            self._dirty = True
+        else:
+            # What was just written is what the next load would parse
+            self._cache["key"] = self._file_key()
+            self._cache["data"] = job.settings
+        if self._save_again:
+            self._save_again = False
+            self._start_save()
     
     def _on_reset(self):
         """Reset to default settings."""
         defaults = self._get_defaults()
         self._apply_settings(defaults)
+        self._dirty = True
     
     def _load_settings(self):
         """Load settings from file."""
         defaults = self._get_defaults()
         
+        key = self._file_key()
         try:
-            if Path(self.SETTINGS_FILE).exists():
-                with open(self.SETTINGS_FILE, "r", encoding="utf-8") as f:
-                    saved = json.load(f)
-                defaults.update(saved)
+            if key is not None:
+                cache = self._cache
+                if cache["key"] != key:
+                    cache["data"] = _json_loads(Path(self.SETTINGS_FILE).read_bytes())
+                    cache["key"] = key
+                defaults.update(cache["data"])
         except Exception as e:
             print(f"Error loading settings: {e}")
         
         self.settings.update(defaults)
-        self._apply_settings(defaults)
+        if self._body_built:
+            self._apply_settings(defaults)
+        self.settings_changed.emit()
+    
+    def _file_key(self) -> Optional[tuple]:
+        """(absolute path, mtime_ns, size) of the settings file, or None if missing."""
+        path = os.path.abspath(self.SETTINGS_FILE)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (path, st.st_mtime_ns, st.st_size)
     
     def _apply_settings(self, settings: dict):
         """Apply settings to UI widgets."""
-        self.download_folder.setText(settings.get("download_folder", ""))
-        self.max_parallel.setValue(settings.get("max_parallel_downloads", 3))
-        self.chapter_folders.setChecked(settings.get("chapter_folders", True))
-        self.overwrite_existing.setChecked(settings.get("overwrite_existing", False))
-        self.retry_count.setValue(settings.get("retry_count", 3))
-        self.timeout.setValue(settings.get("timeout", 30))
-        self.rate_limit.setValue(settings.get("rate_limit", 0.5))
-        self.user_agent.setText(settings.get("user_agent", ""))
-        self.chapter_format.setText(settings.get("chapter_format", "{manga_title}/Chapter {chapter_number}"))
-        self.page_format.setText(settings.get("page_format", "{page_number:03d}"))
-        self.show_notifications.setChecked(settings.get("show_notifications", True))
-        self.minimize_to_tray.setChecked(settings.get("minimize_to_tray", False))
+        # One repaint for the whole form, and no change signals per field
+        self.setUpdatesEnabled(False)
+        try:
+            for attr, key, default, _, setter in self._FIELDS:
+                widget = getattr(self, attr)
+                widget.blockSignals(True)
+                getattr(widget, setter)(settings.get(key, default))
+                widget.blockSignals(False)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _get_defaults(self) -> dict:
-        """Get default settings."""
-        return {
-            "download_folder": str(Path.home() / "Downloads" / "MangaDL"),
-            "max_parallel_downloads": 3,
-            "chapter_folders": True,
-            "overwrite_existing": False,
-            "retry_count": 3,
-            "timeout": 30,
-            "rate_limit": 0.5,
-            "user_agent": "",
-            "chapter_format": "{manga_title}/Chapter {chapter_number}",
-            "page_format": "{page_number:03d}",
-            "show_notifications": True,
-            "minimize_to_tray": False,
-        }
+        """Get default settings (a fresh copy the caller may modify)."""
+        return dict(_DEFAULTS)
@@ -2,64 +2,76 @@
 Application styling and theme definitions.
 Dark theme with orange accent.
 """
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 
 
-class Colors:
+@dataclass(frozen=True, slots=True)
+class _Colors:
     """Color palette for the application."""
     # Base colors
-    BG_DARKEST = "#0D0D0D"
-    BG_DARKER = "#121212"
-    BG_DARK = "#1A1A1A"
-    BG_MEDIUM = "#1E1E1E"
-    BG_LIGHT = "#252525"
-    BG_LIGHTER = "#2D2D2D"
-    BG_HOVER = "#333333"
+    BG_DARKEST: str = "#0D0D0D"
+    BG_DARKER: str = "#121212"
+    BG_DARK: str = "#1A1A1A"
+    BG_MEDIUM: str = "#1E1E1E"
+    BG_LIGHT: str = "#252525"
+    BG_LIGHTER: str = "#2D2D2D"
+    BG_HOVER: str = "#333333"
     
     # Text colors
-    TEXT_PRIMARY = "#FFFFFF"
-    TEXT_SECONDARY = "#B0B0B0"
-    TEXT_MUTED = "#707070"
-    TEXT_DISABLED = "#505050"
+    TEXT_PRIMARY: str = "#FFFFFF"
+    TEXT_SECONDARY: str = "#B0B0B0"
+    TEXT_MUTED: str = "#707070"
+    TEXT_DISABLED: str = "#505050"
     
     # Accent colors
-    ACCENT = "#FF7A18"
-    ACCENT_HOVER = "#FF9A48"
-    ACCENT_PRESSED = "#E56A10"
-    ACCENT_MUTED = "#663300"
+    ACCENT: str = "#FF7A18"
+    ACCENT_HOVER: str = "#FF9A48"
+    ACCENT_PRESSED: str = "#E56A10"
+    ACCENT_MUTED: str = "#663300"
     
     # Status colors
-    SUCCESS = "#4CAF50"
-    WARNING = "#FFC107"
-    ERROR = "#F44336"
-    INFO = "#2196F3"
+    SUCCESS: str = "#4CAF50"
+    WARNING: str = "#FFC107"
+    ERROR: str = "#F44336"
+    INFO: str = "#2196F3"
     
     # Border colors
-    BORDER = "#3A3A3A"
-    BORDER_LIGHT = "#4A4A4A"
-    BORDER_FOCUS = ACCENT
+    BORDER: str = "#3A3A3A"
+    BORDER_LIGHT: str = "#4A4A4A"
+    BORDER_FOCUS: str = ACCENT
     
     # Progress bar
-    PROGRESS_BG = "#2D2D2D"
-    PROGRESS_FG = ACCENT
+    PROGRESS_BG: str = "#2D2D2D"
+    PROGRESS_FG: str = ACCENT
 
 
-STYLES = f"""
+# The palette is a frozen instance, so colours can't be reassigned at runtime
+Colors = _Colors()
+
+
+# Fixed height of table rows: one line of text plus the 8px item padding
+ROW_HEIGHT = 36
+
+
+# Stylesheet template; placeholders name Colors attributes
+_STYLES_TEMPLATE = """
 /* ==================== Global ==================== */
 QWidget {{
-    background-color: {Colors.BG_DARKER};
-    color: {Colors.TEXT_PRIMARY};
+    background-color: {BG_DARKER};
+    color: {TEXT_PRIMARY};
     font-family: "Segoe UI", "SF Pro Display", "Helvetica Neue", sans-serif;
     font-size: 13px;
 }}
 
 QMainWindow {{
-    background-color: {Colors.BG_DARKEST};
+    background-color: {BG_DARKEST};
 }}
 
 /* ==================== Sidebar ==================== */
 #sidebar {{
-    background-color: {Colors.BG_DARKEST};
-    border-right: 1px solid {Colors.BORDER};
+    background-color: {BG_DARKEST};
+    border-right: 1px solid {BORDER};
     min-width: 200px;
     max-width: 200px;
 }}
@@ -67,7 +79,7 @@ QMainWindow {{
 #sidebar_title {{
     font-size: 18px;
     font-weight: 600;
-    color: {Colors.ACCENT};
+    color: {ACCENT};
     padding: 20px 15px 10px 15px;
 }}
 
@@ -77,152 +89,152 @@ QMainWindow {{
     border-radius: 6px;
     padding: 12px 15px;
     text-align: left;
-    color: {Colors.TEXT_SECONDARY};
+    color: {TEXT_SECONDARY};
     font-size: 14px;
     margin: 2px 8px;
 }}
 
 #nav_button:hover {{
-    background-color: {Colors.BG_HOVER};
-    color: {Colors.TEXT_PRIMARY};
+    background-color: {BG_HOVER};
+    color: {TEXT_PRIMARY};
 }}
 
 #nav_button:checked {{
-    background-color: {Colors.ACCENT_MUTED};
-    color: {Colors.ACCENT};
+    background-color: {ACCENT_MUTED};
+    color: {ACCENT};
     font-weight: 500;
 }}
 
 /* ==================== Content Area ==================== */
 #content_area {{
-    background-color: {Colors.BG_DARKER};
+    background-color: {BG_DARKER};
 }}
 
 #page_title {{
     font-size: 24px;
     font-weight: 600;
-    color: {Colors.TEXT_PRIMARY};
+    color: {TEXT_PRIMARY};
     padding: 20px 25px 10px 25px;
 }}
 
 /* ==================== Cards/Panels ==================== */
 #card {{
-    background-color: {Colors.BG_DARK};
-    border: 1px solid {Colors.BORDER};
+    background-color: {BG_DARK};
+    border: 1px solid {BORDER};
     border-radius: 8px;
     padding: 15px;
 }}
 
 #panel {{
-    background-color: {Colors.BG_MEDIUM};
-    border: 1px solid {Colors.BORDER};
+    background-color: {BG_MEDIUM};
+    border: 1px solid {BORDER};
     border-radius: 8px;
 }}
 
 /* ==================== Buttons ==================== */
 QPushButton {{
-    background-color: {Colors.BG_LIGHT};
-    border: 1px solid {Colors.BORDER};
+    background-color: {BG_LIGHT};
+    border: 1px solid {BORDER};
     border-radius: 6px;
     padding: 8px 16px;
-    color: {Colors.TEXT_PRIMARY};
+    color: {TEXT_PRIMARY};
     font-weight: 500;
 }}
 
 QPushButton:hover {{
-    background-color: {Colors.BG_HOVER};
-    border-color: {Colors.BORDER_LIGHT};
+    background-color: {BG_HOVER};
+    border-color: {BORDER_LIGHT};
 }}
 
 QPushButton:pressed {{
-    background-color: {Colors.BG_LIGHTER};
+    background-color: {BG_LIGHTER};
 }}
 
 QPushButton:disabled {{
-    background-color: {Colors.BG_DARK};
-    color: {Colors.TEXT_DISABLED};
-    border-color: {Colors.BG_LIGHT};
+    background-color: {BG_DARK};
+    color: {TEXT_DISABLED};
+    border-color: {BG_LIGHT};
 }}
 
 #primary_button {{
-    background-color: {Colors.ACCENT};
+    background-color: {ACCENT};
     border: none;
-    color: {Colors.BG_DARKEST};
+    color: {BG_DARKEST};
     font-weight: 600;
 }}
 
 #primary_button:hover {{
-    background-color: {Colors.ACCENT_HOVER};
+    background-color: {ACCENT_HOVER};
 }}
 
 #primary_button:pressed {{
-    background-color: {Colors.ACCENT_PRESSED};
+    background-color: {ACCENT_PRESSED};
 }}
 
 #primary_button:disabled {{
-    background-color: {Colors.ACCENT_MUTED};
-    color: {Colors.TEXT_MUTED};
+    background-color: {ACCENT_MUTED};
+    color: {TEXT_MUTED};
 }}
 
 #danger_button {{
     background-color: transparent;
-    border: 1px solid {Colors.ERROR};
-    color: {Colors.ERROR};
+    border: 1px solid {ERROR};
+    color: {ERROR};
 }}
 
 #danger_button:hover {{
-    background-color: {Colors.ERROR};
-    color: {Colors.TEXT_PRIMARY};
+    background-color: {ERROR};
+    color: {TEXT_PRIMARY};
 }}
 
 /* ==================== Inputs ==================== */
 QLineEdit, QSpinBox, QDoubleSpinBox {{
-    background-color: {Colors.BG_LIGHT};
-    border: 1px solid {Colors.BORDER};
+    background-color: {BG_LIGHT};
+    border: 1px solid {BORDER};
     border-radius: 6px;
     padding: 8px 12px;
-    color: {Colors.TEXT_PRIMARY};
-    selection-background-color: {Colors.ACCENT};
+    color: {TEXT_PRIMARY};
+    selection-background-color: {ACCENT};
 }}
 
 QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus {{
-    border-color: {Colors.ACCENT};
+    border-color: {ACCENT};
 }}
 
 QLineEdit:disabled {{
-    background-color: {Colors.BG_DARK};
-    color: {Colors.TEXT_DISABLED};
+    background-color: {BG_DARK};
+    color: {TEXT_DISABLED};
 }}
 
 QTextEdit, QPlainTextEdit {{
-    background-color: {Colors.BG_LIGHT};
-    border: 1px solid {Colors.BORDER};
+    background-color: {BG_LIGHT};
+    border: 1px solid {BORDER};
     border-radius: 6px;
     padding: 10px;
-    color: {Colors.TEXT_PRIMARY};
-    selection-background-color: {Colors.ACCENT};
+    color: {TEXT_PRIMARY};
+    selection-background-color: {ACCENT};
 }}
 
 QTextEdit:focus, QPlainTextEdit:focus {{
-    border-color: {Colors.ACCENT};
+    border-color: {ACCENT};
 }}
 
 /* ==================== ComboBox ==================== */
 QComboBox {{
-    background-color: {Colors.BG_LIGHT};
-    border: 1px solid {Colors.BORDER};
+    background-color: {BG_LIGHT};
+    border: 1px solid {BORDER};
     border-radius: 6px;
     padding: 8px 12px;
-    color: {Colors.TEXT_PRIMARY};
+    color: {TEXT_PRIMARY};
     min-width: 120px;
 }}
 
 QComboBox:hover {{
-    border-color: {Colors.BORDER_LIGHT};
+    border-color: {BORDER_LIGHT};
 }}
 
 QComboBox:focus {{
-    border-color: {Colors.ACCENT};
+    border-color: {ACCENT};
 }}
 
 QComboBox::drop-down {{
@@ -234,53 +246,53 @@ QComboBox::down-arrow {{
     image: none;
     border-left: 5px solid transparent;
     border-right: 5px solid transparent;
-    border-top: 6px solid {Colors.TEXT_SECONDARY};
+    border-top: 6px solid {TEXT_SECONDARY};
     margin-right: 10px;
 }}
 
 QComboBox QAbstractItemView {{
-    background-color: {Colors.BG_MEDIUM};
-    border: 1px solid {Colors.BORDER};
+    background-color: {BG_MEDIUM};
+    border: 1px solid {BORDER};
     border-radius: 6px;
     padding: 4px;
-    selection-background-color: {Colors.ACCENT_MUTED};
+    selection-background-color: {ACCENT_MUTED};
 }}
 
 /* ==================== Table/List ==================== */
 QTableWidget, QTableView {{
-    background-color: {Colors.BG_DARK};
-    border: 1px solid {Colors.BORDER};
+    background-color: {BG_DARK};
+    border: 1px solid {BORDER};
     border-radius: 8px;
-    gridline-color: {Colors.BORDER};
-    selection-background-color: {Colors.ACCENT_MUTED};
+    gridline-color: {BORDER};
+    selection-background-color: {ACCENT_MUTED};
 }}
 
 QTableWidget::item, QTableView::item {{
     padding: 8px;
-    border-bottom: 1px solid {Colors.BORDER};
+    border-bottom: 1px solid {BORDER};
 }}
 
 QTableWidget::item:selected, QTableView::item:selected {{
-    background-color: {Colors.ACCENT_MUTED};
-    color: {Colors.ACCENT};
+    background-color: {ACCENT_MUTED};
+    color: {ACCENT};
 }}
 
 QTableWidget::item:hover, QTableView::item:hover {{
-    background-color: {Colors.BG_HOVER};
+    background-color: {BG_HOVER};
 }}
 
 QHeaderView::section {{
-    background-color: {Colors.BG_MEDIUM};
-    color: {Colors.TEXT_SECONDARY};
+    background-color: {BG_MEDIUM};
+    color: {TEXT_SECONDARY};
     padding: 10px 8px;
     border: none;
-    border-bottom: 1px solid {Colors.BORDER};
+    border-bottom: 1px solid {BORDER};
     font-weight: 600;
 }}
 
 QListWidget {{
-    background-color: {Colors.BG_DARK};
-    border: 1px solid {Colors.BORDER};
+    background-color: {BG_DARK};
+    border: 1px solid {BORDER};
     border-radius: 8px;
     padding: 4px;
 }}
@@ -292,17 +304,17 @@ QListWidget::item {{
 }}
 
 QListWidget::item:selected {{
-    background-color: {Colors.ACCENT_MUTED};
-    color: {Colors.ACCENT};
+    background-color: {ACCENT_MUTED};
+    color: {ACCENT};
 }}
 
 QListWidget::item:hover {{
-    background-color: {Colors.BG_HOVER};
+    background-color: {BG_HOVER};
 }}
 
 /* ==================== Progress Bar ==================== */
 QProgressBar {{
-    background-color: {Colors.PROGRESS_BG};
+    background-color: {PROGRESS_BG};
     border: none;
     border-radius: 4px;
     height: 8px;
@@ -310,26 +322,26 @@ QProgressBar {{
 }}
 
 QProgressBar::chunk {{
-    background-color: {Colors.ACCENT};
+    background-color: {ACCENT};
     border-radius: 4px;
 }}
 
 /* ==================== Scroll Bars ==================== */
 QScrollBar:vertical {{
-    background-color: {Colors.BG_DARK};
+    background-color: {BG_DARK};
     width: 12px;
     border-radius: 6px;
 }}
 
 QScrollBar::handle:vertical {{
-    background-color: {Colors.BG_LIGHTER};
+    background-color: {BG_LIGHTER};
     border-radius: 6px;
     min-height: 30px;
     margin: 2px;
 }}
 
 QScrollBar::handle:vertical:hover {{
-    background-color: {Colors.BG_HOVER};
+    background-color: {BG_HOVER};
 }}
 
 QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
@@ -337,20 +349,20 @@ QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
 }}
 
 QScrollBar:horizontal {{
-    background-color: {Colors.BG_DARK};
+    background-color: {BG_DARK};
     height: 12px;
     border-radius: 6px;
 }}
 
 QScrollBar::handle:horizontal {{
-    background-color: {Colors.BG_LIGHTER};
+    background-color: {BG_LIGHTER};
     border-radius: 6px;
     min-width: 30px;
     margin: 2px;
 }}
 
 QScrollBar::handle:horizontal:hover {{
-    background-color: {Colors.BG_HOVER};
+    background-color: {BG_HOVER};
 }}
 
 QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
@@ -359,7 +371,7 @@ QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
 
 /* ==================== Splitter ==================== */
 QSplitter::handle {{
-    background-color: {Colors.BORDER};
+    background-color: {BORDER};
 }}
 
 QSplitter::handle:horizontal {{
@@ -372,49 +384,68 @@ QSplitter::handle:vertical {{
 
 /* ==================== Tab Widget ==================== */
 QTabWidget::pane {{
-    background-color: {Colors.BG_DARK};
-    border: 1px solid {Colors.BORDER};
+    background-color: {BG_DARK};
+    border: 1px solid {BORDER};
     border-radius: 8px;
     padding: 10px;
 }}
 
 QTabBar::tab {{
-    background-color: {Colors.BG_MEDIUM};
+    background-color: {BG_MEDIUM};
     border: none;
     padding: 10px 20px;
     margin-right: 2px;
     border-top-left-radius: 6px;
     border-top-right-radius: 6px;
-    color: {Colors.TEXT_SECONDARY};
+    color: {TEXT_SECONDARY};
 }}
 
 QTabBar::tab:selected {{
-    background-color: {Colors.BG_DARK};
-    color: {Colors.ACCENT};
+    background-color: {BG_DARK};
+    color: {ACCENT};
 }}
 
 QTabBar::tab:hover:!selected {{
-    background-color: {Colors.BG_HOVER};
+    background-color: {BG_HOVER};
 }}
 
 /* ==================== Labels ==================== */
 #section_label {{
     font-size: 12px;
     font-weight: 600;
-    color: {Colors.TEXT_MUTED};
+    color: {TEXT_MUTED};
     text-transform: uppercase;
     letter-spacing: 1px;
 }}
 
 #value_label {{
-    color: {Colors.TEXT_PRIMARY};
+    color: {TEXT_PRIMARY};
     font-size: 14px;
 }}
 
+#info_label {{
+    color: {TEXT_SECONDARY};
+}}
+
+#count_label {{
+    color: {TEXT_MUTED};
+}}
+
+#hint_label {{
+    color: {TEXT_MUTED};
+    font-size: 11px;
+}}
+
+#detail_title {{
+    font-size: 16px;
+    font-weight: 600;
+    color: {TEXT_PRIMARY};
+}}
+
 /* ==================== Log Console ==================== */
 #log_console {{
-    background-color: {Colors.BG_DARKEST};
-    border: 1px solid {Colors.BORDER};
+    background-color: {BG_DARKEST};
+    border: 1px solid {BORDER};
     border-radius: 6px;
     font-family: "Cascadia Code", "Fira Code", "Consolas", monospace;
     font-size: 12px;
@@ -423,7 +454,7 @@ QTabBar::tab:hover:!selected {{
 
 /* ==================== Toggle Switch ==================== */
 #toggle {{
-    background-color: {Colors.BG_LIGHT};
+    background-color: {BG_LIGHT};
     border: none;
     border-radius: 12px;
     min-width: 44px;
@@ -433,46 +464,46 @@ QTabBar::tab:hover:!selected {{
 }}
 
 #toggle:checked {{
-    background-color: {Colors.ACCENT};
+    background-color: {ACCENT};
 }}
 
 /* ==================== Tooltips ==================== */
 QToolTip {{
-    background-color: {Colors.BG_MEDIUM};
-    color: {Colors.TEXT_PRIMARY};
-    border: 1px solid {Colors.BORDER};
+    background-color: {BG_MEDIUM};
+    color: {TEXT_PRIMARY};
+    border: 1px solid {BORDER};
     border-radius: 4px;
     padding: 6px 10px;
 }}
 
 /* ==================== Status Badges ==================== */
 #badge_queued {{
-    background-color: {Colors.TEXT_MUTED};
-    color: {Colors.TEXT_PRIMARY};
+    background-color: {TEXT_MUTED};
+    color: {TEXT_PRIMARY};
     border-radius: 10px;
     padding: 2px 8px;
     font-size: 11px;
 }}
 
 #badge_downloading {{
-    background-color: {Colors.INFO};
-    color: {Colors.TEXT_PRIMARY};
+    background-color: {INFO};
+    color: {TEXT_PRIMARY};
     border-radius: 10px;
     padding: 2px 8px;
     font-size: 11px;
 }}
 
 #badge_completed {{
-    background-color: {Colors.SUCCESS};
-    color: {Colors.TEXT_PRIMARY};
+    background-color: {SUCCESS};
+    color: {TEXT_PRIMARY};
     border-radius: 10px;
     padding: 2px 8px;
     font-size: 11px;
 }}
 
 #badge_failed {{
-    background-color: {Colors.ERROR};
-    color: {Colors.TEXT_PRIMARY};
+    background-color: {ERROR};
+    color: {TEXT_PRIMARY};
     border-radius: 10px;
     padding: 2px 8px;
     font-size: 11px;
@@ -487,16 +518,47 @@ QCheckBox::indicator {{
     width: 18px;
     height: 18px;
     border-radius: 4px;
-    border: 1px solid {Colors.BORDER};
-    background-color: {Colors.BG_LIGHT};
+    border: 1px solid {BORDER};
+    background-color: {BG_LIGHT};
 }}
 
 QCheckBox::indicator:checked {{
-    background-color: {Colors.ACCENT};
-    border-color: {Colors.ACCENT};
+    background-color: {ACCENT};
+    border-color: {ACCENT};
 }}
 
 QCheckBox::indicator:hover {{
-    border-color: {Colors.ACCENT};
+    border-color: {ACCENT};
 }}
 """
+
+# Palette names and values, as filled into the template
+_DEFAULT_PALETTE = asdict(Colors)
+
+
+@lru_cache(maxsize=4)
+def _render_styles(palette: tuple[tuple[str, str], ...]) -> str:
+    return _STYLES_TEMPLATE.format_map(dict(palette))
+
+
+def render_styles(overrides: dict[str, str] | None = None) -> str:
+    """
+    Render the stylesheet with some palette colours replaced.
+    The last few palettes are cached, so switching back and forth between
+    themes reuses the rendered sheet.
+    """
+    palette = _DEFAULT_PALETTE if not overrides else {**_DEFAULT_PALETTE, **overrides}
+    return _render_styles(tuple(sorted(palette.items())))
+
+
+STYLES = render_styles()
+
+
+def apply_styles(app, overrides: dict[str, str] | None = None) -> None:
+    """
+    Install the stylesheet on the application.
+    This is the only place a stylesheet is set: per-widget sheets are each
+    parsed separately, so widgets get an object name and a rule above instead.
+    overrides replaces palette colours by name (see render_styles).
+    """
+    app.setStyleSheet(render_styles(overrides) if overrides else STYLES)